@@ -88,6 +88,10 @@ class ERROR_MESSAGES(str, Enum):
         "Oops! The URL you provided is invalid. Please double-check and try again."
     )
 
+    INCOMPLETE_CURSOR = lambda fields="": (
+        f"Pagination cursor is incomplete. Pass {fields} together, taken from the last item of the previous page."
+    )
+
     WEB_SEARCH_ERROR = (
         lambda err="": f"{err if err else 'Oops! Something went wrong while searching the web.'}"
     )
@@ -328,6 +328,11 @@ DATABASE_ENABLE_SQLITE_WAL = (
     os.environ.get("DATABASE_ENABLE_SQLITE_WAL", "False").lower() == "true"
 )
 
+# Run the peewee and alembic migrations when the app is imported. Multi-worker
+# deployments can migrate once (e.g. from an init container) and disable this in
+# the workers so they don't all inspect and lock the database on startup.
+ENABLE_DB_MIGRATIONS = os.environ.get("ENABLE_DB_MIGRATIONS", "True").lower() == "true"
+
 DATABASE_USER_ACTIVE_STATUS_UPDATE_INTERVAL = os.environ.get(
     "DATABASE_USER_ACTIVE_STATUS_UPDATE_INTERVAL", None
 )
@@ -339,6 +344,15 @@ if DATABASE_USER_ACTIVE_STATUS_UPDATE_INTERVAL is not None:
     except Exception:
         DATABASE_USER_ACTIVE_STATUS_UPDATE_INTERVAL = 0.0
 
+# Files the knowledge reindex processes at once. SQLite allows a single writer,
+# so it defaults to one file at a time there.
+KNOWLEDGE_REINDEX_CONCURRENCY = os.environ.get("KNOWLEDGE_REINDEX_CONCURRENCY", "")
+
+try:
+    KNOWLEDGE_REINDEX_CONCURRENCY = max(1, int(KNOWLEDGE_REINDEX_CONCURRENCY))
+except Exception:
+    KNOWLEDGE_REINDEX_CONCURRENCY = 1 if DATABASE_URL.startswith("sqlite") else 8
+
 # Enable public visibility of active user count (when disabled, only admins can see it)
 ENABLE_PUBLIC_ACTIVE_USERS_COUNT = (
     os.environ.get("ENABLE_PUBLIC_ACTIVE_USERS_COUNT", "True").lower() == "true"
@@ -1,10 +1,10 @@
 import os
-import json
 import logging
 from contextlib import contextmanager
 from typing import Any, Optional
 
 from open_webui.internal.wrappers import register_connection
+from open_webui.utils import json
 from open_webui.env import (
     OPEN_WEBUI_DIR,
     DATABASE_URL,
@@ -14,6 +14,7 @@ from open_webui.env import (
     DATABASE_POOL_SIZE,
     DATABASE_POOL_TIMEOUT,
     DATABASE_ENABLE_SQLITE_WAL,
+    ENABLE_DB_MIGRATIONS,
 )
 from peewee_migrate import Router
 from sqlalchemy import Dialect, create_engine, MetaData, event, types
@@ -75,7 +76,8 @@ def handle_peewee_migration(DATABASE_URL):
         assert db.is_closed(), "Database connection is still open."
 
 
-handle_peewee_migration(DATABASE_URL)
+if ENABLE_DB_MIGRATIONS:
+    handle_peewee_migration(DATABASE_URL)
 
 
 SQLALCHEMY_DATABASE_URL = DATABASE_URL
@@ -138,7 +140,14 @@ else:
                 SQLALCHEMY_DATABASE_URL, pool_pre_ping=True, poolclass=NullPool
             )
     else:
-        engine = create_engine(SQLALCHEMY_DATABASE_URL, pool_pre_ping=True)
+        # Keep SQLAlchemy's default pool size, but still honour the timeout and
+        # recycle settings so idle connections are not left to go stale
+        engine = create_engine(
+            SQLALCHEMY_DATABASE_URL,
+            pool_timeout=DATABASE_POOL_TIMEOUT,
+            pool_recycle=DATABASE_POOL_RECYCLE,
+            pool_pre_ping=True,
+        )
 
 
 SessionLocal = sessionmaker(
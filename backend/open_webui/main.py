@@ -24,7 +24,6 @@ import anyio.to_thread
 import requests
 from redis import Redis
 
-
 from fastapi import (
     Depends,
     FastAPI,
@@ -37,6 +36,7 @@ from fastapi import (
     applications,
     BackgroundTasks,
 )
+from fastapi.encoders import jsonable_encoder
 from fastapi.openapi.docs import get_swagger_ui_html
 
 from fastapi.middleware.cors import CORSMiddleware
@@ -491,6 +491,7 @@ from open_webui.utils.chat import (
     chat_action as chat_action_handler,
 )
 from open_webui.utils.embeddings import generate_embeddings
+from open_webui.utils.json import dumps as json_dumps
 from open_webui.utils.middleware import process_chat_payload, process_chat_response
 from open_webui.utils.access_control import has_access
 
@@ -629,6 +630,9 @@ async def lifespan(app: FastAPI):
     if hasattr(app.state, "redis_task_command_listener"):
         app.state.redis_task_command_listener.cancel()
 
+    if getattr(app.state, "openai_session", None):
+        await app.state.openai_session.close()
+
 
 app = FastAPI(
     title="Open WebUI",
@@ -1483,7 +1487,13 @@ async def get_models(
     log.debug(
         f"/api/models returned filtered models accessible to the user: {json.dumps([model.get('id') for model in models])}"
     )
-    return {"data": models}
+
+    # The model list is fetched on every page load and can be large; encode
+    # the plain dicts directly instead of walking them via jsonable_encoder
+    return Response(
+        content=json_dumps({"data": models}, default=jsonable_encoder),
+        media_type="application/json",
+    )
 
 
 @app.get("/api/models/base")
@@ -71,10 +71,5 @@ def upgrade() -> None:
 
 
 def downgrade() -> None:
-    # Drop indexes first
-    op.drop_index("idx_oauth_session_user_provider", table_name="oauth_session")
-    op.drop_index("idx_oauth_session_expires_at", table_name="oauth_session")
-    op.drop_index("idx_oauth_session_user_id", table_name="oauth_session")
-
-    # Drop the table
+    # Dropping the table drops its indexes with it
     op.drop_table("oauth_session")
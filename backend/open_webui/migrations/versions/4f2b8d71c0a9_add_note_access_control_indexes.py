@@ -0,0 +1,48 @@
+"""Add note access_control GIN indexes
+
+Revision ID: 4f2b8d71c0a9
+Revises: e3a1c9d04b7f
+Create Date: 2026-10-15 11:20:53.104562
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "4f2b8d71c0a9"
+down_revision: Union[str, None] = "e3a1c9d04b7f"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+PERMISSIONS = ("read", "write")
+
+
+def upgrade() -> None:
+    # Postgres only: Notes._has_permission filters group grants with
+    # CAST(access_control -> '<permission>' -> 'group_ids' AS JSONB) @> '[...]',
+    # so index exactly that expression to let the planner use GIN instead of
+    # reparsing every row's json.
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    for permission in PERMISSIONS:
+        op.create_index(
+            f"note_access_control_{permission}_group_ids_idx",
+            "note",
+            [sa.text(f"((access_control -> '{permission}' -> 'group_ids')::jsonb)")],
+            postgresql_using="gin",
+        )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    for permission in PERMISSIONS:
+        op.drop_index(
+            f"note_access_control_{permission}_group_ids_idx", table_name="note"
+        )
@@ -0,0 +1,61 @@
+"""Add message indexes
+
+Revision ID: 57a778dabb5e
+Revises: c440947495f3
+Create Date: 2026-10-15 09:12:04.318220
+
+"""
+
+from contextlib import nullcontext
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "57a778dabb5e"
+down_revision: Union[str, None] = "c440947495f3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _concurrently():
+    # The message table is usually populated by the time this runs, so on
+    # Postgres build the indexes without holding a write lock on it.
+    # CONCURRENTLY cannot run inside a transaction block.
+    if op.get_bind().dialect.name == "postgresql":
+        return op.get_context().autocommit_block(), {"postgresql_concurrently": True}
+    return nullcontext(), {}
+
+
+def upgrade() -> None:
+    context, kwargs = _concurrently()
+    with context:
+        # WHERE channel_id = ... AND parent_id ... ORDER BY created_at DESC
+        op.create_index(
+            "message_channel_id_parent_id_created_at_idx",
+            "message",
+            ["channel_id", "parent_id", "created_at"],
+            **kwargs,
+        )
+        # WHERE parent_id = ... ORDER BY created_at DESC
+        op.create_index(
+            "message_parent_id_created_at_idx",
+            "message",
+            ["parent_id", "created_at"],
+            **kwargs,
+        )
+
+
+def downgrade() -> None:
+    context, kwargs = _concurrently()
+    with context:
+        op.drop_index(
+            "message_parent_id_created_at_idx", table_name="message", **kwargs
+        )
+        op.drop_index(
+            "message_channel_id_parent_id_created_at_idx",
+            table_name="message",
+            **kwargs,
+        )
@@ -0,0 +1,33 @@
+"""Add file updated_at indexes
+
+Revision ID: 9c3e5a7f2d81
+Revises: b7d52e9a1f36
+Create Date: 2026-10-15 13:40:52.118406
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "9c3e5a7f2d81"
+down_revision: Union[str, None] = "b7d52e9a1f36"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # ORDER BY updated_at DESC, id DESC (keyset pagination)
+    op.create_index("file_updated_at_id_idx", "file", ["updated_at", "id"])
+    # WHERE user_id = ... ORDER BY updated_at DESC, id DESC
+    op.create_index(
+        "file_user_id_updated_at_id_idx", "file", ["user_id", "updated_at", "id"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("file_user_id_updated_at_id_idx", table_name="file")
+    op.drop_index("file_updated_at_id_idx", table_name="file")
@@ -23,11 +23,15 @@ branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
 
-def _drop_sqlite_indexes_for_column(table_name, column_name, conn):
+def _drop_sqlite_indexes_for_columns(table_name, column_names, conn):
     """
     SQLite requires manual removal of any indexes referencing a column
     before ALTER TABLE ... DROP COLUMN can succeed.
+
+    The index list is read once per table and checked against all columns,
+    instead of re-reading it for every column being dropped.
     """
+    column_names = set(column_names)
     indexes = conn.execute(sa.text(f"PRAGMA index_list('{table_name}')")).fetchall()
 
     for idx in indexes:
@@ -37,8 +41,8 @@ def _drop_sqlite_indexes_for_column(table_name, column_name, conn):
             sa.text(f"PRAGMA index_info('{index_name}')")
         ).fetchall()
 
-        indexed_cols = [row[2] for row in idx_info]  # col names
-        if column_name in indexed_cols:
+        indexed_cols = {row[2] for row in idx_info}  # col names
+        if column_names & indexed_cols:
             conn.execute(sa.text(f"DROP INDEX IF EXISTS {index_name}"))
 
 
@@ -189,8 +193,7 @@ def upgrade() -> None:
             )
 
     if conn.dialect.name == "sqlite":
-        _drop_sqlite_indexes_for_column("user", "api_key", conn)
-        _drop_sqlite_indexes_for_column("user", "oauth_sub", conn)
+        _drop_sqlite_indexes_for_columns("user", ["api_key", "oauth_sub"], conn)
 
     with op.batch_alter_table("user") as batch_op:
         batch_op.drop_column("api_key")
@@ -0,0 +1,36 @@
+"""Add partial index on pinned messages
+
+Revision ID: b7d52e9a1f36
+Revises: 4f2b8d71c0a9
+Create Date: 2026-10-15 12:02:18.730145
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b7d52e9a1f36"
+down_revision: Union[str, None] = "4f2b8d71c0a9"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Pinned messages are a tiny fraction of the table, so a partial index
+    # keeps the pinned list lookup small. Both Postgres and SQLite support it.
+    is_pinned = sa.column("is_pinned") == sa.true()
+    op.create_index(
+        "message_channel_id_pinned_at_idx",
+        "message",
+        ["channel_id", "pinned_at"],
+        postgresql_where=is_pinned,
+        sqlite_where=is_pinned,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("message_channel_id_pinned_at_idx", table_name="message")
@@ -0,0 +1,37 @@
+"""Add channel and group member indexes
+
+Revision ID: d5a8c3e1f6b2
+Revises: 9c3e5a7f2d81
+Create Date: 2026-10-15 14:05:37.502914
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d5a8c3e1f6b2"
+down_revision: Union[str, None] = "9c3e5a7f2d81"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # WHERE channel_id = ... AND user_id = ...
+    op.create_index(
+        "channel_member_channel_id_user_id_idx",
+        "channel_member",
+        ["channel_id", "user_id"],
+    )
+    # WHERE user_id = ...
+    op.create_index("channel_member_user_id_idx", "channel_member", ["user_id"])
+    op.create_index("group_member_user_id_idx", "group_member", ["user_id"])
+
+
+def downgrade() -> None:
+    op.drop_index("group_member_user_id_idx", table_name="group_member")
+    op.drop_index("channel_member_user_id_idx", table_name="channel_member")
+    op.drop_index("channel_member_channel_id_user_id_idx", table_name="channel_member")
@@ -0,0 +1,31 @@
+"""Add unique index on channel_webhook token
+
+Revision ID: e3a1c9d04b7f
+Revises: 57a778dabb5e
+Create Date: 2026-10-15 10:41:27.552913
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e3a1c9d04b7f"
+down_revision: Union[str, None] = "57a778dabb5e"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Webhook tokens are the only lookup key for inbound posts and must never
+    # collide, so enforce that in the database rather than at generation time.
+    op.create_index(
+        "channel_webhook_token_idx", "channel_webhook", ["token"], unique=True
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("channel_webhook_token_idx", table_name="channel_webhook")
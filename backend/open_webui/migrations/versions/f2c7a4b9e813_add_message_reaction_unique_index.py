@@ -0,0 +1,44 @@
+"""Add unique index on message_reaction
+
+Revision ID: f2c7a4b9e813
+Revises: d5a8c3e1f6b2
+Create Date: 2026-10-15 16:22:48.190375
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "f2c7a4b9e813"
+down_revision: Union[str, None] = "d5a8c3e1f6b2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Reactions were deduplicated with a SELECT before inserting, which let
+    # concurrent requests through; keep one row per user and emoji first.
+    op.execute(
+        sa.text(
+            "DELETE FROM message_reaction WHERE id NOT IN ("
+            "SELECT MIN(id) FROM message_reaction "
+            "GROUP BY message_id, user_id, name)"
+        )
+    )
+    op.create_index(
+        "message_reaction_message_id_user_id_name_idx",
+        "message_reaction",
+        ["message_id", "user_id", "name"],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "message_reaction_message_id_user_id_name_idx",
+        table_name="message_reaction",
+    )
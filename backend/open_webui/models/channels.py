@@ -6,7 +6,7 @@ from typing import Optional
 from open_webui.internal.db import Base, get_db
 from open_webui.models.groups import Groups
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 from sqlalchemy.dialects.postgresql import JSONB
 
 
@@ -15,6 +15,7 @@ from sqlalchemy import (
     Boolean,
     Column,
     ForeignKey,
+    Index,
     String,
     Text,
     JSON,
@@ -22,7 +23,7 @@ from sqlalchemy import (
     case,
     cast,
 )
-from sqlalchemy import or_, func, select, and_, text
+from sqlalchemy import or_, func, select, and_, text, update
 from sqlalchemy.sql import exists
 
 ####################
@@ -117,6 +118,13 @@ class ChannelMember(Base):
     created_at = Column(BigInteger)
     updated_at = Column(BigInteger)
 
+    __table_args__ = (
+        # WHERE channel_id = ... AND user_id = ...
+        Index("channel_member_channel_id_user_id_idx", "channel_id", "user_id"),
+        # WHERE user_id = ...
+        Index("channel_member_user_id_idx", "user_id"),
+    )
+
 
 class ChannelMemberModel(BaseModel):
     model_config = ConfigDict(from_attributes=True)
@@ -199,6 +207,11 @@ class ChannelWebhook(Base):
     created_at = Column(BigInteger, nullable=False)
     updated_at = Column(BigInteger, nullable=False)
 
+    __table_args__ = (
+        # Inbound webhooks are resolved by token alone
+        Index("channel_webhook_token_idx", "token", unique=True),
+    )
+
 
 class ChannelWebhookModel(BaseModel):
     model_config = ConfigDict(from_attributes=True)
@@ -217,6 +230,10 @@ class ChannelWebhookModel(BaseModel):
     updated_at: int  # timestamp in epoch (time_ns)
 
 
+# Validate whole result sets in one call instead of one model_validate per row
+ChannelModelList = TypeAdapter(list[ChannelModel])
+ChannelMemberModelList = TypeAdapter(list[ChannelMemberModel])
+
 ####################
 # Forms
 ####################
@@ -283,7 +300,7 @@ class ChannelTable:
         for uid in user_ids:
             model = ChannelMemberModel(
                 **{
-                    "id": str(uuid.uuid4()),
+                    "id": uuid.uuid4().hex,
                     "channel_id": channel_id,
                     "user_id": uid,
                     "status": "joined",
@@ -307,6 +324,7 @@ class ChannelTable:
         self, form_data: CreateChannelForm, user_id: str
     ) -> Optional[ChannelModel]:
         with get_db() as db:
+            now = int(time.time_ns())
             channel = ChannelModel(
                 **{
                     **form_data.model_dump(),
@@ -314,8 +332,8 @@ class ChannelTable:
                     "name": form_data.name.lower(),
                     "id": str(uuid.uuid4()),
                     "user_id": user_id,
-                    "created_at": int(time.time_ns()),
-                    "updated_at": int(time.time_ns()),
+                    "created_at": now,
+                    "updated_at": now,
                 }
             )
             new_channel = Channel(**channel.model_dump())
@@ -339,8 +357,8 @@ class ChannelTable:
 
     def get_channels(self) -> list[ChannelModel]:
         with get_db() as db:
-            channels = db.query(Channel).all()
-            return [ChannelModel.model_validate(channel) for channel in channels]
+            channels = db.query(Channel).yield_per(200)
+            return ChannelModelList.validate_python(channels, from_attributes=True)
 
     def _has_permission(self, db, query, filter: dict, permission: str = "read"):
         group_ids = filter.get("group_ids", [])
@@ -386,9 +404,7 @@ class ChannelTable:
 
     def get_channels_by_user_id(self, user_id: str) -> list[ChannelModel]:
         with get_db() as db:
-            user_group_ids = [
-                group.id for group in Groups.get_groups_by_member_id(user_id)
-            ]
+            user_group_ids = Groups.get_group_ids_by_member_id(user_id)
 
             membership_channels = (
                 db.query(Channel)
@@ -543,20 +559,21 @@ class ChannelTable:
                 return ChannelMemberModel.model_validate(existing_membership)
 
             # Create new membership
+            now = int(time.time_ns())
             channel_member = ChannelMemberModel(
                 **{
-                    "id": str(uuid.uuid4()),
+                    "id": uuid.uuid4().hex,
                     "channel_id": channel_id,
                     "user_id": user_id,
                     "status": "joined",
                     "is_active": True,
                     "is_channel_muted": False,
                     "is_channel_pinned": False,
-                    "joined_at": int(time.time_ns()),
+                    "joined_at": now,
                     "left_at": None,
-                    "last_read_at": int(time.time_ns()),
-                    "created_at": int(time.time_ns()),
-                    "updated_at": int(time.time_ns()),
+                    "last_read_at": now,
+                    "created_at": now,
+                    "updated_at": now,
                 }
             )
             new_membership = ChannelMember(**channel_member.model_dump())
@@ -567,24 +584,25 @@ class ChannelTable:
 
     def leave_channel(self, channel_id: str, user_id: str) -> bool:
         with get_db() as db:
-            membership = (
+            now = int(time.time_ns())
+            result = (
                 db.query(ChannelMember)
                 .filter(
                     ChannelMember.channel_id == channel_id,
                     ChannelMember.user_id == user_id,
                 )
-                .first()
+                .update(
+                    {
+                        "status": "left",
+                        "is_active": False,
+                        "left_at": now,
+                        "updated_at": now,
+                    },
+                    synchronize_session=False,
+                )
             )
-            if not membership:
-                return False
-
-            membership.status = "left"
-            membership.is_active = False
-            membership.left_at = int(time.time_ns())
-            membership.updated_at = int(time.time_ns())
-
             db.commit()
-            return True
+            return result > 0
 
     def get_member_by_channel_and_user_id(
         self, channel_id: str, user_id: str
@@ -600,76 +618,89 @@ class ChannelTable:
             )
             return ChannelMemberModel.model_validate(membership) if membership else None
 
+    def get_members_by_user_id_and_channel_ids(
+        self, user_id: str, channel_ids: list[str]
+    ) -> dict[str, ChannelMemberModel]:
+        with get_db() as db:
+            memberships = db.query(ChannelMember).filter(
+                ChannelMember.user_id == user_id,
+                ChannelMember.channel_id.in_(channel_ids),
+            )
+            return {
+                membership.channel_id: ChannelMemberModel.model_validate(membership)
+                for membership in memberships
+            }
+
     def get_members_by_channel_id(self, channel_id: str) -> list[ChannelMemberModel]:
         with get_db() as db:
             memberships = (
                 db.query(ChannelMember)
                 .filter(ChannelMember.channel_id == channel_id)
-                .all()
+                .yield_per(200)
+            )
+            return ChannelMemberModelList.validate_python(
+                memberships, from_attributes=True
             )
-            return [
-                ChannelMemberModel.model_validate(membership)
-                for membership in memberships
-            ]
 
     def pin_channel(self, channel_id: str, user_id: str, is_pinned: bool) -> bool:
         with get_db() as db:
-            membership = (
+            result = (
                 db.query(ChannelMember)
                 .filter(
                     ChannelMember.channel_id == channel_id,
                     ChannelMember.user_id == user_id,
                 )
-                .first()
+                .update(
+                    {
+                        "is_channel_pinned": is_pinned,
+                        "updated_at": int(time.time_ns()),
+                    },
+                    synchronize_session=False,
+                )
             )
-            if not membership:
-                return False
-
-            membership.is_channel_pinned = is_pinned
-            membership.updated_at = int(time.time_ns())
-
             db.commit()
-            return True
+            return result > 0
 
     def update_member_last_read_at(self, channel_id: str, user_id: str) -> bool:
         with get_db() as db:
-            membership = (
+            now = int(time.time_ns())
+            result = (
                 db.query(ChannelMember)
                 .filter(
                     ChannelMember.channel_id == channel_id,
                     ChannelMember.user_id == user_id,
                 )
-                .first()
+                .update(
+                    {
+                        "last_read_at": now,
+                        "updated_at": now,
+                    },
+                    synchronize_session=False,
+                )
             )
-            if not membership:
-                return False
-
-            membership.last_read_at = int(time.time_ns())
-            membership.updated_at = int(time.time_ns())
-
             db.commit()
-            return True
+            return result > 0
 
     def update_member_active_status(
         self, channel_id: str, user_id: str, is_active: bool
     ) -> bool:
         with get_db() as db:
-            membership = (
+            result = (
                 db.query(ChannelMember)
                 .filter(
                     ChannelMember.channel_id == channel_id,
                     ChannelMember.user_id == user_id,
                 )
-                .first()
+                .update(
+                    {
+                        "is_active": is_active,
+                        "updated_at": int(time.time_ns()),
+                    },
+                    synchronize_session=False,
+                )
             )
-            if not membership:
-                return False
-
-            membership.is_active = is_active
-            membership.updated_at = int(time.time_ns())
-
             db.commit()
-            return True
+            return result > 0
 
     def is_user_channel_member(self, channel_id: str, user_id: str) -> bool:
         with get_db() as db:
@@ -685,17 +716,43 @@ class ChannelTable:
 
     def get_channel_by_id(self, id: str) -> Optional[ChannelModel]:
         with get_db() as db:
-            channel = db.query(Channel).filter(Channel.id == id).first()
+            channel = db.get(Channel, id)
             return ChannelModel.model_validate(channel) if channel else None
 
+    def get_channel_with_membership_by_id(
+        self, id: str, user_id: str
+    ) -> tuple[Optional[ChannelModel], bool]:
+        # Loads the channel and the user's membership in one round trip for
+        # the access checks that need both
+        with get_db() as db:
+            row = (
+                db.query(Channel, ChannelMember.id)
+                .outerjoin(
+                    ChannelMember,
+                    and_(
+                        ChannelMember.channel_id == Channel.id,
+                        ChannelMember.user_id == user_id,
+                    ),
+                )
+                .filter(Channel.id == id)
+                .first()
+            )
+            if not row:
+                return None, False
+
+            channel, member_id = row
+            return ChannelModel.model_validate(channel), member_id is not None
+
     def get_channels_by_file_id(self, file_id: str) -> list[ChannelModel]:
         with get_db() as db:
             channel_files = (
                 db.query(ChannelFile).filter(ChannelFile.file_id == file_id).all()
             )
             channel_ids = [cf.channel_id for cf in channel_files]
-            channels = db.query(Channel).filter(Channel.id.in_(channel_ids)).all()
-            return [ChannelModel.model_validate(channel) for channel in channels]
+            channels = (
+                db.query(Channel).filter(Channel.id.in_(channel_ids)).yield_per(200)
+            )
+            return ChannelModelList.validate_python(channels, from_attributes=True)
 
     def get_channels_by_file_id_and_user_id(
         self, file_id: str, user_id: str
@@ -724,7 +781,7 @@ class ChannelTable:
                 return []
 
             # Preload user's group membership
-            user_group_ids = [g.id for g in Groups.get_groups_by_member_id(user_id)]
+            user_group_ids = Groups.get_group_ids_by_member_id(user_id)
 
             allowed_channels = []
 
@@ -798,9 +855,7 @@ class ChannelTable:
             query = db.query(Channel).filter(Channel.id == id)
 
             # Determine user groups
-            user_group_ids = [
-                group.id for group in Groups.get_groups_by_member_id(user_id)
-            ]
+            user_group_ids = Groups.get_group_ids_by_member_id(user_id)
 
             # Apply ACL rules
             query = self._has_permission(
@@ -820,21 +875,35 @@ class ChannelTable:
     def update_channel_by_id(
         self, id: str, form_data: ChannelForm
     ) -> Optional[ChannelModel]:
-        with get_db() as db:
-            channel = db.query(Channel).filter(Channel.id == id).first()
-            if not channel:
-                return None
-
-            channel.name = form_data.name
-            channel.description = form_data.description
-            channel.is_private = form_data.is_private
+        values = {
+            "name": form_data.name,
+            "description": form_data.description,
+            "is_private": form_data.is_private,
+            "data": form_data.data,
+            "meta": form_data.meta,
+            "access_control": form_data.access_control,
+            "updated_at": int(time.time_ns()),
+        }
 
-            channel.data = form_data.data
-            channel.meta = form_data.meta
+        with get_db() as db:
+            if not db.bind.dialect.update_returning:
+                channel = db.get(Channel, id)
+                if not channel:
+                    return None
 
-            channel.access_control = form_data.access_control
-            channel.updated_at = int(time.time_ns())
+                for key, value in values.items():
+                    setattr(channel, key, value)
 
+                db.commit()
+                return ChannelModel.model_validate(channel)
+
+            # UPDATE ... RETURNING, one round trip instead of SELECT then UPDATE
+            channel = db.scalars(
+                update(Channel)
+                .where(Channel.id == id)
+                .values(**values)
+                .returning(Channel)
+            ).first()
             db.commit()
             return ChannelModel.model_validate(channel) if channel else None
 
@@ -842,26 +911,22 @@ class ChannelTable:
         self, channel_id: str, file_id: str, user_id: str
     ) -> Optional[ChannelFileModel]:
         with get_db() as db:
+            now = int(time.time())
             channel_file = ChannelFileModel(
                 **{
-                    "id": str(uuid.uuid4()),
+                    "id": uuid.uuid4().hex,
                     "channel_id": channel_id,
                     "file_id": file_id,
                     "user_id": user_id,
-                    "created_at": int(time.time()),
-                    "updated_at": int(time.time()),
+                    "created_at": now,
+                    "updated_at": now,
                 }
             )
 
             try:
-                result = ChannelFile(**channel_file.model_dump())
-                db.add(result)
+                db.add(ChannelFile(**channel_file.model_dump()))
                 db.commit()
-                db.refresh(result)
-                if result:
-                    return ChannelFileModel.model_validate(result)
-                else:
-                    return None
+                return channel_file
             except Exception:
                 return None
 
@@ -870,19 +935,44 @@ class ChannelTable:
     ) -> bool:
         try:
             with get_db() as db:
-                channel_file = (
+                result = (
                     db.query(ChannelFile)
                     .filter_by(channel_id=channel_id, file_id=file_id)
-                    .first()
+                    .update(
+                        {
+                            "message_id": message_id,
+                            "updated_at": int(time.time()),
+                        },
+                        synchronize_session=False,
+                    )
                 )
-                if not channel_file:
-                    return False
-
-                channel_file.message_id = message_id
-                channel_file.updated_at = int(time.time())
+                db.commit()
+                return result > 0
+        except Exception:
+            return False
 
+    def set_file_message_id_in_channel_by_ids(
+        self, channel_id: str, file_ids: list[str], message_id: str
+    ) -> bool:
+        try:
+            with get_db() as db:
+                # Link all of the message's files in one UPDATE and commit
+                result = (
+                    db.query(ChannelFile)
+                    .filter(
+                        ChannelFile.channel_id == channel_id,
+                        ChannelFile.file_id.in_(file_ids),
+                    )
+                    .update(
+                        {
+                            "message_id": message_id,
+                            "updated_at": int(time.time()),
+                        },
+                        synchronize_session=False,
+                    )
+                )
                 db.commit()
-                return True
+                return result > 0
         except Exception:
             return False
 
@@ -899,6 +989,10 @@ class ChannelTable:
 
     def delete_channel_by_id(self, id: str):
         with get_db() as db:
+            # SQLite does not enforce foreign keys here, so clear dependent rows
+            # explicitly in the same transaction rather than relying on CASCADE
+            db.query(ChannelMember).filter(ChannelMember.channel_id == id).delete()
+            db.query(ChannelFile).filter(ChannelFile.channel_id == id).delete()
             db.query(Channel).filter(Channel.id == id).delete()
             db.commit()
             return True
@@ -1,5 +1,6 @@
 import logging
 import json
+import re
 import time
 import uuid
 from typing import Optional
@@ -21,7 +22,8 @@ from sqlalchemy import (
     Index,
     UniqueConstraint,
 )
-from sqlalchemy import or_, func, select, and_, text
+from sqlalchemy import or_, func, select, and_, text, cast, update
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB
 from sqlalchemy.sql import exists
 from sqlalchemy.sql.expression import bindparam
 
@@ -31,6 +33,10 @@ from sqlalchemy.sql.expression import bindparam
 
 log = logging.getLogger(__name__)
 
+# Message ids that can be quoted into a SQLite JSON path as is; it has no
+# escape for '"' inside a quoted label
+SQLITE_JSON_PATH_KEY = re.compile(r"[\w.:-]+")
+
 
 class Chat(Base):
     __tablename__ = "chat"
@@ -241,27 +247,24 @@ class ChatTable:
     def insert_new_chat(self, user_id: str, form_data: ChatForm) -> Optional[ChatModel]:
         with get_db() as db:
             id = str(uuid.uuid4())
-            chat = ChatModel(
-                **{
-                    "id": id,
-                    "user_id": user_id,
-                    "title": self._clean_null_bytes(
-                        form_data.chat["title"]
-                        if "title" in form_data.chat
-                        else "New Chat"
-                    ),
-                    "chat": self._clean_null_bytes(form_data.chat),
-                    "folder_id": form_data.folder_id,
-                    "created_at": int(time.time()),
-                    "updated_at": int(time.time()),
-                }
-            )
+            now = int(time.time())
+            # The chat JSON can be large; build the row straight from the
+            # values instead of validating, dumping and re-reading it
+            values = {
+                "id": id,
+                "user_id": user_id,
+                "title": self._clean_null_bytes(
+                    form_data.chat["title"] if "title" in form_data.chat else "New Chat"
+                ),
+                "chat": self._clean_null_bytes(form_data.chat),
+                "folder_id": form_data.folder_id,
+                "created_at": now,
+                "updated_at": now,
+            }
 
-            chat_item = Chat(**chat.model_dump())
-            db.add(chat_item)
+            db.add(Chat(**values))
             db.commit()
-            db.refresh(chat_item)
-            return ChatModel.model_validate(chat_item) if chat_item else None
+            return ChatModel.model_construct(**values)
 
     def _chat_import_form_to_chat_model(
         self, user_id: str, form_data: ChatImportForm
@@ -404,10 +407,69 @@ class ChatTable:
 
     def add_message_status_to_chat_by_id_and_message_id(
         self, id: str, message_id: str, status: dict
-    ) -> Optional[ChatModel]:
+    ) -> bool:
+        # Status events arrive many times per generation; append in SQL so
+        # each one does not read, decode and rewrite the whole chat history.
+        try:
+            with get_db() as db:
+                if db.bind.dialect.name == "sqlite" and SQLITE_JSON_PATH_KEY.fullmatch(
+                    message_id
+                ):
+                    message_path = f'$.history.messages."{message_id}"'
+                    path = f"{message_path}.statusHistory"
+                    chat = func.json_set(
+                        Chat.chat,
+                        path,
+                        func.json_insert(
+                            func.coalesce(func.json_extract(Chat.chat, path), "[]"),
+                            "$[#]",
+                            func.json(json.dumps(self._clean_null_bytes(status))),
+                        ),
+                    )
+                    is_message = func.json_type(Chat.chat, message_path) == "object"
+                elif db.bind.dialect.name == "postgresql":
+                    # Paths are bound as text[], so the id needs no escaping.
+                    # jsonb_set works on a jsonb copy of the chat and casting it
+                    # back stores that normalised form: keys reordered,
+                    # whitespace dropped and duplicate keys collapsed, none of
+                    # which changes the chat as the app decodes it
+                    message_path = ["history", "messages", message_id]
+                    path = cast([*message_path, "statusHistory"], ARRAY(Text))
+                    document = cast(Chat.chat, JSONB)
+                    status_history = func.coalesce(
+                        document.op("#>")(path), cast([], JSONB)
+                    ).op("||")(
+                        func.jsonb_build_array(
+                            cast(self._clean_null_bytes(status), JSONB)
+                        )
+                    )
+                    chat = cast(func.jsonb_set(document, path, status_history), JSON)
+                    is_message = (
+                        func.jsonb_typeof(
+                            document.op("#>")(cast(message_path, ARRAY(Text)))
+                        )
+                        == "object"
+                    )
+                else:
+                    return self._add_message_status_to_chat(id, message_id, status)
+
+                result = db.execute(
+                    update(Chat)
+                    .where(Chat.id == id, is_message)
+                    .values(chat=chat, updated_at=int(time.time()))
+                    .execution_options(synchronize_session=False)
+                )
+                db.commit()
+                return result.rowcount > 0
+        except Exception:
+            return False
+
+    def _add_message_status_to_chat(
+        self, id: str, message_id: str, status: dict
+    ) -> bool:
         chat = self.get_chat_by_id(id)
         if chat is None:
-            return None
+            return False
 
         chat = chat.chat
         history = chat.get("history", {})
@@ -418,7 +480,7 @@ class ChatTable:
             history["messages"][message_id]["statusHistory"] = status_history
 
         chat["history"] = history
-        return self.update_chat_by_id(id, chat)
+        return self.update_chat_by_id(id, chat) is not None
 
     def add_message_files_by_id_and_message_id(
         self, id: str, message_id: str, files: list[dict]
@@ -677,15 +739,14 @@ class ChatTable:
 
             all_chats = query.all()
 
-            # result has to be destructured from sqlalchemy `row` and mapped to a dict since the `ChatModel`is not the returned dataclass.
+            # The columns are already typed by the database; skip per-row
+            # validation since this list can hold thousands of chats
             return [
-                ChatTitleIdResponse.model_validate(
-                    {
-                        "id": chat[0],
-                        "title": chat[1],
-                        "updated_at": chat[2],
-                        "created_at": chat[3],
-                    }
+                ChatTitleIdResponse.model_construct(
+                    id=chat.id,
+                    title=chat.title,
+                    updated_at=chat.updated_at,
+                    created_at=chat.created_at,
                 )
                 for chat in all_chats
             ]
@@ -742,10 +803,12 @@ class ChatTable:
 
     def get_chats(self, skip: int = 0, limit: int = 50) -> list[ChatModel]:
         with get_db() as db:
+            # Used for the full export; stream the rows in batches rather than
+            # loading every chat row at once
             all_chats = (
                 db.query(Chat)
                 # .limit(limit).offset(skip)
-                .order_by(Chat.updated_at.desc())
+                .order_by(Chat.updated_at.desc()).yield_per(200)
             )
             return [ChatModel.model_validate(chat) for chat in all_chats]
 
@@ -766,7 +829,7 @@ class ChatTable:
             if limit is not None:
                 query = query.limit(limit)
 
-            all_chats = query.all()
+            all_chats = query.yield_per(200)
 
             return ChatListResponse(
                 **{
@@ -125,14 +125,15 @@ class FeedbackTable:
     ) -> Optional[FeedbackModel]:
         with get_db() as db:
             id = str(uuid.uuid4())
+            now = int(time.time())
             feedback = FeedbackModel(
                 **{
                     "id": id,
                     "user_id": user_id,
                     "version": 0,
                     **form_data.model_dump(),
-                    "created_at": int(time.time()),
-                    "updated_at": int(time.time()),
+                    "created_at": now,
+                    "updated_at": now,
                 }
             )
             try:
@@ -151,7 +152,7 @@ class FeedbackTable:
     def get_feedback_by_id(self, id: str) -> Optional[FeedbackModel]:
         try:
             with get_db() as db:
-                feedback = db.query(Feedback).filter_by(id=id).first()
+                feedback = db.get(Feedback, id)
                 if not feedback:
                     return None
                 return FeedbackModel.model_validate(feedback)
@@ -267,7 +268,7 @@ class FeedbackTable:
         self, id: str, form_data: FeedbackForm
     ) -> Optional[FeedbackModel]:
         with get_db() as db:
-            feedback = db.query(Feedback).filter_by(id=id).first()
+            feedback = db.get(Feedback, id)
             if not feedback:
                 return None
 
@@ -305,7 +306,7 @@ class FeedbackTable:
 
     def delete_feedback_by_id(self, id: str) -> bool:
         with get_db() as db:
-            feedback = db.query(Feedback).filter_by(id=id).first()
+            feedback = db.get(Feedback, id)
             if not feedback:
                 return False
             db.delete(feedback)
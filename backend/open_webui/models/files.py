@@ -1,10 +1,24 @@
 import logging
+import re
 import time
+from fnmatch import fnmatch
 from typing import Optional
 
 from open_webui.internal.db import Base, JSONField, get_db
 from pydantic import BaseModel, ConfigDict
-from sqlalchemy import BigInteger, Column, String, Text, JSON
+from sqlalchemy import (
+    BigInteger,
+    Column,
+    Index,
+    String,
+    Text,
+    JSON,
+    case,
+    cast,
+    func,
+    tuple_,
+)
+from sqlalchemy.dialects.postgresql import JSONB
 
 log = logging.getLogger(__name__)
 
@@ -30,6 +44,13 @@ class File(Base):
     created_at = Column(BigInteger)
     updated_at = Column(BigInteger)
 
+    __table_args__ = (
+        # ORDER BY updated_at DESC, id DESC (keyset pagination)
+        Index("file_updated_at_id_idx", "updated_at", "id"),
+        # WHERE user_id = ... ORDER BY updated_at DESC, id DESC
+        Index("file_user_id_updated_at_id_idx", "user_id", "updated_at", "id"),
+    )
+
 
 class FileModel(BaseModel):
     model_config = ConfigDict(from_attributes=True)
@@ -108,14 +129,55 @@ class FileListResponse(BaseModel):
 
 
 class FilesTable:
+    def _query_files(self, db, include_content: bool = True):
+        if include_content:
+            return db.query(File)
+
+        # data["content"] holds the full extracted text; drop it in the database
+        # so list views don't transfer and parse it for every file
+        if db.bind.dialect.name == "postgresql":
+            data = cast(File.data, JSONB)
+            # "-" is only defined on objects, leave JSON null/scalars as they are
+            data = case(
+                (func.jsonb_typeof(data) == "object", data.op("-")("content")),
+                else_=data,
+            )
+        else:
+            data = func.json_remove(File.data, "$.content", type_=JSON)
+
+        return db.query(
+            *(column for column in File.__table__.columns if column.name != "data"),
+            data.label("data"),
+        )
+
+    def _paginate_files(
+        self,
+        query,
+        cursor_updated_at: Optional[int] = None,
+        cursor_id: Optional[str] = None,
+        limit: Optional[int] = None,
+    ):
+        # Keyset pagination: continue after the last (updated_at, id) seen
+        # instead of an OFFSET, so each page only reads `limit` index entries
+        if cursor_updated_at is not None and cursor_id is not None:
+            query = query.filter(
+                tuple_(File.updated_at, File.id) < (cursor_updated_at, cursor_id)
+            )
+
+        query = query.order_by(File.updated_at.desc(), File.id.desc())
+        if limit is not None:
+            query = query.limit(limit)
+        return query
+
     def insert_new_file(self, user_id: str, form_data: FileForm) -> Optional[FileModel]:
         with get_db() as db:
+            now = int(time.time())
             file = FileModel(
                 **{
                     **form_data.model_dump(),
                     "user_id": user_id,
-                    "created_at": int(time.time()),
-                    "updated_at": int(time.time()),
+                    "created_at": now,
+                    "updated_at": now,
                 }
             )
 
@@ -151,10 +213,45 @@ class FilesTable:
             except Exception:
                 return None
 
+    def get_file_path_by_id(self, id: str) -> Optional[str]:
+        with get_db() as db:
+            try:
+                # Only the storage path is needed, skip decoding data and meta
+                return db.query(File.path).filter(File.id == id).scalar()
+            except Exception:
+                return None
+
+    def get_file_status_by_id(self, id: str) -> Optional[dict]:
+        with get_db() as db:
+            try:
+                # Read only the processing status out of data; the row also
+                # holds the extracted content, which pollers don't need
+                file = (
+                    db.query(
+                        File.data["status"].as_string().label("status"),
+                        File.data["error"].as_string().label("error"),
+                    )
+                    .filter(File.id == id)
+                    .first()
+                )
+                if file:
+                    return {"status": file.status, "error": file.error}
+                else:
+                    return None
+            except Exception:
+                return None
+
     def get_file_metadata_by_id(self, id: str) -> Optional[FileMetadataResponse]:
         with get_db() as db:
             try:
-                file = db.get(File, id)
+                # Skip the data column, it holds the extracted file content
+                file = (
+                    db.query(
+                        File.id, File.hash, File.meta, File.created_at, File.updated_at
+                    )
+                    .filter(File.id == id)
+                    .first()
+                )
                 return FileMetadataResponse(
                     id=file.id,
                     hash=file.hash,
@@ -165,15 +262,57 @@ class FilesTable:
             except Exception:
                 return None
 
-    def get_files(self) -> list[FileModel]:
+    def search_files_by_filename(
+        self,
+        pattern: str,
+        user_id: Optional[str] = None,
+        include_content: bool = True,
+    ) -> list[FileModel]:
+        pattern = pattern.lower()
         with get_db() as db:
-            return [FileModel.model_validate(file) for file in db.query(File).all()]
+            query = self._query_files(db, include_content)
+            if user_id is not None:
+                query = query.filter(File.user_id == user_id)
+
+            # Narrow the rows in SQL with the LIKE equivalent of the wildcard
+            # pattern instead of loading every file; [seq] classes have no LIKE
+            # form, and SQLite's lower() only folds ASCII, so those patterns
+            # are only matched below
+            if "[" not in pattern and (
+                pattern.isascii() or db.bind.dialect.name != "sqlite"
+            ):
+                like = re.sub(r"([\\%_])", r"\\\1", pattern)
+                like = like.replace("*", "%").replace("?", "_")
+                query = query.filter(func.lower(File.filename).like(like, escape="\\"))
+
+            return [
+                FileModel.model_validate(file)
+                for file in query.order_by(File.updated_at.desc(), File.id.desc())
+                if fnmatch(file.filename.lower(), pattern)
+            ]
+
+    def get_files(
+        self,
+        include_content: bool = True,
+        cursor_updated_at: Optional[int] = None,
+        cursor_id: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> list[FileModel]:
+        with get_db() as db:
+            query = self._paginate_files(
+                self._query_files(db, include_content),
+                cursor_updated_at,
+                cursor_id,
+                limit,
+            )
+            return [FileModel.model_validate(file) for file in query.all()]
 
     def check_access_by_user_id(self, id, user_id, permission="write") -> bool:
-        file = self.get_file_by_id(id)
-        if not file:
+        with get_db() as db:
+            owner = db.query(File.user_id).filter(File.id == id).first()
+        if not owner:
             return False
-        if file.user_id == user_id:
+        if owner.user_id == user_id:
             return True
         # Implement additional access control logic here as needed
         return False
@@ -206,19 +345,29 @@ class FilesTable:
                 .all()
             ]
 
-    def get_files_by_user_id(self, user_id: str) -> list[FileModel]:
+    def get_files_by_user_id(
+        self,
+        user_id: str,
+        include_content: bool = True,
+        cursor_updated_at: Optional[int] = None,
+        cursor_id: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> list[FileModel]:
         with get_db() as db:
-            return [
-                FileModel.model_validate(file)
-                for file in db.query(File).filter_by(user_id=user_id).all()
-            ]
+            query = self._paginate_files(
+                self._query_files(db, include_content).filter(File.user_id == user_id),
+                cursor_updated_at,
+                cursor_id,
+                limit,
+            )
+            return [FileModel.model_validate(file) for file in query.all()]
 
     def update_file_by_id(
         self, id: str, form_data: FileUpdateForm
     ) -> Optional[FileModel]:
         with get_db() as db:
             try:
-                file = db.query(File).filter_by(id=id).first()
+                file = db.get(File, id)
 
                 if form_data.hash is not None:
                     file.hash = form_data.hash
@@ -236,10 +385,42 @@ class FilesTable:
                 log.exception(f"Error updating file completely by id: {e}")
                 return None
 
+    def update_files_by_ids(self, updates: dict[str, FileUpdateForm]) -> bool:
+        with get_db() as db:
+            try:
+                # Load every file in one query and commit once, rather than a
+                # read and a commit per file
+                now = int(time.time())
+                for file in db.query(File).filter(File.id.in_(updates.keys())):
+                    form_data = updates[file.id]
+
+                    if form_data.hash is not None:
+                        file.hash = form_data.hash
+
+                    if form_data.data is not None:
+                        file.data = {
+                            **(file.data if file.data else {}),
+                            **form_data.data,
+                        }
+
+                    if form_data.meta is not None:
+                        file.meta = {
+                            **(file.meta if file.meta else {}),
+                            **form_data.meta,
+                        }
+
+                    file.updated_at = now
+
+                db.commit()
+                return True
+            except Exception as e:
+                log.exception(f"Error updating files by ids: {e}")
+                return False
+
     def update_file_hash_by_id(self, id: str, hash: str) -> Optional[FileModel]:
         with get_db() as db:
             try:
-                file = db.query(File).filter_by(id=id).first()
+                file = db.get(File, id)
                 file.hash = hash
                 file.updated_at = int(time.time())
                 db.commit()
@@ -251,7 +432,7 @@ class FilesTable:
     def update_file_data_by_id(self, id: str, data: dict) -> Optional[FileModel]:
         with get_db() as db:
             try:
-                file = db.query(File).filter_by(id=id).first()
+                file = db.get(File, id)
                 file.data = {**(file.data if file.data else {}), **data}
                 file.updated_at = int(time.time())
                 db.commit()
@@ -263,7 +444,7 @@ class FilesTable:
     def update_file_metadata_by_id(self, id: str, meta: dict) -> Optional[FileModel]:
         with get_db() as db:
             try:
-                file = db.query(File).filter_by(id=id).first()
+                file = db.get(File, id)
                 file.meta = {**(file.meta if file.meta else {}), **meta}
                 file.updated_at = int(time.time())
                 db.commit()
@@ -87,14 +87,15 @@ class FolderTable:
     ) -> Optional[FolderModel]:
         with get_db() as db:
             id = str(uuid.uuid4())
+            now = int(time.time())
             folder = FolderModel(
                 **{
                     "id": id,
                     "user_id": user_id,
                     **(form_data.model_dump(exclude_unset=True) or {}),
                     "parent_id": parent_id,
-                    "created_at": int(time.time()),
-                    "updated_at": int(time.time()),
+                    "created_at": now,
+                    "updated_at": now,
                 }
             )
             try:
@@ -124,27 +125,38 @@ class FolderTable:
         except Exception:
             return None
 
+    def _get_descendant_folders(self, db, id: str, user_id: str) -> list[Folder]:
+        # Walk the tree a level at a time, fetching all siblings of a level in
+        # one query instead of one query per folder
+        descendants = []
+        seen_ids = {id}
+        parent_ids = [id]
+        while parent_ids:
+            children = [
+                child
+                for child in db.query(Folder).filter(
+                    Folder.user_id == user_id, Folder.parent_id.in_(parent_ids)
+                )
+                if child.id not in seen_ids
+            ]
+            descendants.extend(children)
+            parent_ids = [child.id for child in children]
+            seen_ids.update(parent_ids)
+        return descendants
+
     def get_children_folders_by_id_and_user_id(
         self, id: str, user_id: str
     ) -> Optional[list[FolderModel]]:
         try:
             with get_db() as db:
-                folders = []
-
-                def get_children(folder):
-                    children = self.get_folders_by_parent_id_and_user_id(
-                        folder.id, user_id
-                    )
-                    for child in children:
-                        get_children(child)
-                        folders.append(child)
-
                 folder = db.query(Folder).filter_by(id=id, user_id=user_id).first()
                 if not folder:
                     return None
 
-                get_children(folder)
-                return folders
+                return [
+                    FolderModel.model_validate(child)
+                    for child in self._get_descendant_folders(db, folder.id, user_id)
+                ]
         except Exception:
             return None
 
@@ -286,22 +298,14 @@ class FolderTable:
 
                 folder_ids.append(folder.id)
 
-                # Delete all children folders
-                def delete_children(folder):
-                    folder_children = self.get_folders_by_parent_id_and_user_id(
-                        folder.id, user_id
-                    )
-                    for folder_child in folder_children:
-
-                        delete_children(folder_child)
-                        folder_ids.append(folder_child.id)
-
-                        folder = db.query(Folder).filter_by(id=folder_child.id).first()
-                        db.delete(folder)
-                        db.commit()
-
-                delete_children(folder)
-                db.delete(folder)
+                # Delete the folder and all of its children in one statement
+                folder_ids.extend(
+                    child.id
+                    for child in self._get_descendant_folders(db, folder.id, user_id)
+                )
+                db.query(Folder).filter(Folder.id.in_(folder_ids)).delete(
+                    synchronize_session=False
+                )
                 db.commit()
                 return folder_ids
         except Exception as e:
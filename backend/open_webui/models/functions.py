@@ -105,13 +105,14 @@ class FunctionsTable:
     def insert_new_function(
         self, user_id: str, type: str, form_data: FunctionForm
     ) -> Optional[FunctionModel]:
+        now = int(time.time())
         function = FunctionModel(
             **{
                 **form_data.model_dump(),
                 "user_id": user_id,
                 "type": type,
-                "updated_at": int(time.time()),
-                "created_at": int(time.time()),
+                "updated_at": now,
+                "created_at": now,
             }
         )
 
@@ -19,9 +19,13 @@ from sqlalchemy import (
     and_,
     func,
     ForeignKey,
+    Index,
     cast,
+    insert,
     or_,
+    UniqueConstraint,
 )
+from sqlalchemy.dialects import postgresql, sqlite
 
 
 log = logging.getLogger(__name__)
@@ -80,6 +84,13 @@ class GroupMember(Base):
     created_at = Column(BigInteger, nullable=True)
     updated_at = Column(BigInteger, nullable=True)
 
+    __table_args__ = (
+        # Created by the group_member migration; also serves group_id lookups
+        UniqueConstraint("group_id", "user_id", name="uq_group_member_group_user"),
+        # WHERE user_id = ...
+        Index("group_member_user_id_idx", "user_id"),
+    )
+
 
 class GroupMemberModel(BaseModel):
     id: str
@@ -123,13 +134,14 @@ class GroupTable:
         self, user_id: str, form_data: GroupForm
     ) -> Optional[GroupModel]:
         with get_db() as db:
+            now = int(time.time())
             group = GroupModel(
                 **{
                     **form_data.model_dump(exclude_none=True),
                     "id": str(uuid.uuid4()),
                     "user_id": user_id,
-                    "created_at": int(time.time()),
-                    "updated_at": int(time.time()),
+                    "created_at": now,
+                    "updated_at": now,
                 }
             )
 
@@ -238,10 +250,19 @@ class GroupTable:
                 .all()
             ]
 
+    def get_group_ids_by_member_id(self, user_id: str) -> list[str]:
+        with get_db() as db:
+            return [
+                group_id
+                for (group_id,) in db.query(GroupMember.group_id)
+                .filter(GroupMember.user_id == user_id)
+                .all()
+            ]
+
     def get_group_by_id(self, id: str) -> Optional[GroupModel]:
         try:
             with get_db() as db:
-                group = db.query(Group).filter_by(id=id).first()
+                group = db.get(Group, id)
                 return GroupModel.model_validate(group) if group else None
         except Exception:
             return None
@@ -381,13 +402,14 @@ class GroupTable:
         with get_db() as db:
             for group_name in group_names:
                 if group_name not in existing_group_names:
+                    now = int(time.time())
                     new_group = GroupModel(
                         id=str(uuid.uuid4()),
                         user_id=user_id,
                         name=group_name,
                         description="",
-                        created_at=int(time.time()),
-                        updated_at=int(time.time()),
+                        created_at=now,
+                        updated_at=now,
                     )
                     try:
                         result = Group(**new_group.model_dump())
@@ -465,28 +487,51 @@ class GroupTable:
     ) -> Optional[GroupModel]:
         try:
             with get_db() as db:
-                group = db.query(Group).filter_by(id=id).first()
+                group = db.get(Group, id)
                 if not group:
                     return None
 
                 now = int(time.time())
-
-                for user_id in user_ids or []:
-                    try:
-                        db.add(
-                            GroupMember(
-                                id=str(uuid.uuid4()),
-                                group_id=id,
-                                user_id=user_id,
-                                created_at=now,
-                                updated_at=now,
-                            )
+                user_ids = list(dict.fromkeys(user_ids or []))
+
+                # Add everyone with one executemany INSERT instead of a flush
+                # per user, letting uq_group_member_group_user skip existing
+                # members, including ones added by a concurrent request
+                dialect = db.bind.dialect.name
+                if dialect in ("postgresql", "sqlite"):
+                    dialect_insert = (
+                        postgresql.insert if dialect == "postgresql" else sqlite.insert
+                    )
+                    stmt = dialect_insert(GroupMember).on_conflict_do_nothing(
+                        index_elements=["group_id", "user_id"]
+                    )
+                else:
+                    existing_user_ids = {
+                        user_id
+                        for (user_id,) in db.query(GroupMember.user_id).filter(
+                            GroupMember.group_id == id,
+                            GroupMember.user_id.in_(user_ids),
                         )
-                        db.flush()  # Detect unique constraint violation early
-                    except Exception:
-                        db.rollback()  # Clear failed INSERT
-                        db.begin()  # Start a new transaction
-                        continue  # Duplicate → ignore
+                    }
+                    user_ids = [
+                        user_id
+                        for user_id in user_ids
+                        if user_id not in existing_user_ids
+                    ]
+                    stmt = insert(GroupMember)
+
+                new_members = [
+                    {
+                        "id": str(uuid.uuid4()),
+                        "group_id": id,
+                        "user_id": user_id,
+                        "created_at": now,
+                        "updated_at": now,
+                    }
+                    for user_id in user_ids
+                ]
+                if new_members:
+                    db.execute(stmt, new_members)
 
                 group.updated_at = now
                 db.commit()
@@ -503,7 +548,7 @@ class GroupTable:
     ) -> Optional[GroupModel]:
         try:
             with get_db() as db:
-                group = db.query(Group).filter_by(id=id).first()
+                group = db.get(Group, id)
                 if not group:
                     return None
 
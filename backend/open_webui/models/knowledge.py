@@ -13,7 +13,13 @@ from open_webui.models.files import (
     FileModelResponse,
 )
 from open_webui.models.groups import Groups
-from open_webui.models.users import User, UserModel, Users, UserResponse
+from open_webui.models.users import (
+    User,
+    UserModel,
+    Users,
+    UserResponse,
+    get_rows_with_users,
+)
 
 
 from pydantic import BaseModel, ConfigDict
@@ -25,11 +31,12 @@ from sqlalchemy import (
     Text,
     JSON,
     UniqueConstraint,
+    insert,
     or_,
 )
 
 from open_webui.utils.access_control import has_access
-from open_webui.utils.db.access_control import has_permission
+from open_webui.utils.db.access_control import get_accessible_rows, has_permission
 
 
 log = logging.getLogger(__name__)
@@ -160,13 +167,14 @@ class KnowledgeTable:
         self, user_id: str, form_data: KnowledgeForm
     ) -> Optional[KnowledgeModel]:
         with get_db() as db:
+            now = int(time.time())
             knowledge = KnowledgeModel(
                 **{
                     **form_data.model_dump(),
                     "id": str(uuid.uuid4()),
                     "user_id": user_id,
-                    "created_at": int(time.time()),
-                    "updated_at": int(time.time()),
+                    "created_at": now,
+                    "updated_at": now,
                 }
             )
 
@@ -333,27 +341,28 @@ class KnowledgeTable:
             return False
         if knowledge.user_id == user_id:
             return True
-        user_group_ids = {group.id for group in Groups.get_groups_by_member_id(user_id)}
+        user_group_ids = set(Groups.get_group_ids_by_member_id(user_id))
         return has_access(user_id, permission, knowledge.access_control, user_group_ids)
 
     def get_knowledge_bases_by_user_id(
         self, user_id: str, permission: str = "write"
     ) -> list[KnowledgeUserModel]:
-        knowledge_bases = self.get_knowledge_bases()
-        user_group_ids = {group.id for group in Groups.get_groups_by_member_id(user_id)}
-        return [
-            knowledge_base
-            for knowledge_base in knowledge_bases
-            if knowledge_base.user_id == user_id
-            or has_access(
-                user_id, permission, knowledge_base.access_control, user_group_ids
+        with get_db() as db:
+            items = get_accessible_rows(
+                db.query(Knowledge, User)
+                .outerjoin(User, User.id == Knowledge.user_id)
+                .order_by(Knowledge.updated_at.desc()),
+                Knowledge,
+                user_id,
+                permission,
             )
-        ]
+
+            return get_rows_with_users(items, KnowledgeModel, KnowledgeUserModel)
 
     def get_knowledge_by_id(self, id: str) -> Optional[KnowledgeModel]:
         try:
             with get_db() as db:
-                knowledge = db.query(Knowledge).filter_by(id=id).first()
+                knowledge = db.get(Knowledge, id)
                 return KnowledgeModel.model_validate(knowledge) if knowledge else None
         except Exception:
             return None
@@ -368,7 +377,7 @@ class KnowledgeTable:
         if knowledge.user_id == user_id:
             return knowledge
 
-        user_group_ids = {group.id for group in Groups.get_groups_by_member_id(user_id)}
+        user_group_ids = set(Groups.get_group_ids_by_member_id(user_id))
         if has_access(user_id, "write", knowledge.access_control, user_group_ids):
             return knowledge
         return None
@@ -486,8 +495,22 @@ class KnowledgeTable:
     def get_file_metadatas_by_id(self, knowledge_id: str) -> list[FileMetadataResponse]:
         try:
             with get_db() as db:
-                files = self.get_files_by_id(knowledge_id)
-                return [FileMetadataResponse(**file.model_dump()) for file in files]
+                # Select just the metadata columns, not data with its content
+                return [
+                    FileMetadataResponse(
+                        id=file.id,
+                        hash=file.hash,
+                        meta=file.meta,
+                        created_at=file.created_at,
+                        updated_at=file.updated_at,
+                    )
+                    for file in db.query(
+                        File.id, File.hash, File.meta, File.created_at, File.updated_at
+                    )
+                    .join(KnowledgeFile, File.id == KnowledgeFile.file_id)
+                    .filter(KnowledgeFile.knowledge_id == knowledge_id)
+                    .all()
+                ]
         except Exception:
             return []
 
@@ -495,29 +518,67 @@ class KnowledgeTable:
         self, knowledge_id: str, file_id: str, user_id: str
     ) -> Optional[KnowledgeFileModel]:
         with get_db() as db:
+            now = int(time.time())
             knowledge_file = KnowledgeFileModel(
                 **{
-                    "id": str(uuid.uuid4()),
+                    "id": uuid.uuid4().hex,
                     "knowledge_id": knowledge_id,
                     "file_id": file_id,
                     "user_id": user_id,
-                    "created_at": int(time.time()),
-                    "updated_at": int(time.time()),
+                    "created_at": now,
+                    "updated_at": now,
                 }
             )
 
             try:
-                result = KnowledgeFile(**knowledge_file.model_dump())
-                db.add(result)
+                db.add(KnowledgeFile(**knowledge_file.model_dump()))
                 db.commit()
-                db.refresh(result)
-                if result:
-                    return KnowledgeFileModel.model_validate(result)
-                else:
-                    return None
+                return knowledge_file
             except Exception:
                 return None
 
+    def add_files_to_knowledge_by_id(
+        self, knowledge_id: str, file_ids: list[str], user_id: str
+    ) -> list[str]:
+        with get_db() as db:
+            existing_file_ids = {
+                file_id
+                for (file_id,) in db.query(KnowledgeFile.file_id).filter(
+                    KnowledgeFile.knowledge_id == knowledge_id,
+                    KnowledgeFile.file_id.in_(file_ids),
+                )
+            }
+            new_file_ids = [
+                file_id
+                for file_id in dict.fromkeys(file_ids)
+                if file_id not in existing_file_ids
+            ]
+            if not new_file_ids:
+                return []
+
+            now = int(time.time())
+            try:
+                # One multi-row INSERT instead of a commit + refresh per file
+                db.execute(
+                    insert(KnowledgeFile),
+                    [
+                        {
+                            "id": uuid.uuid4().hex,
+                            "knowledge_id": knowledge_id,
+                            "file_id": file_id,
+                            "user_id": user_id,
+                            "created_at": now,
+                            "updated_at": now,
+                        }
+                        for file_id in new_file_ids
+                    ],
+                )
+                db.commit()
+                return new_file_ids
+            except Exception as e:
+                log.exception(e)
+                return []
+
     def remove_file_from_knowledge_by_id(self, knowledge_id: str, file_id: str) -> bool:
         try:
             with get_db() as db:
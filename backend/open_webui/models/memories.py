@@ -45,13 +45,14 @@ class MemoriesTable:
         with get_db() as db:
             id = str(uuid.uuid4())
 
+            now = int(time.time())
             memory = MemoryModel(
                 **{
                     "id": id,
                     "user_id": user_id,
                     "content": content,
-                    "created_at": int(time.time()),
-                    "updated_at": int(time.time()),
+                    "created_at": now,
+                    "updated_at": now,
                 }
             )
             result = Memory(**memory.model_dump())
@@ -10,8 +10,9 @@ from open_webui.models.channels import Channels, ChannelMember
 
 
 from pydantic import BaseModel, ConfigDict, field_validator
-from sqlalchemy import BigInteger, Boolean, Column, String, Text, JSON
-from sqlalchemy import or_, func, select, and_, text
+from sqlalchemy import BigInteger, Boolean, Column, String, Text, JSON, Index
+from sqlalchemy import or_, func, select, and_, text, true, tuple_
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.sql import exists
 
 ####################
@@ -27,6 +28,17 @@ class MessageReaction(Base):
     name = Column(Text)
     created_at = Column(BigInteger)
 
+    __table_args__ = (
+        # One reaction per user and emoji, also serves WHERE message_id = ...
+        Index(
+            "message_reaction_message_id_user_id_name_idx",
+            "message_id",
+            "user_id",
+            "name",
+            unique=True,
+        ),
+    )
+
 
 class MessageReactionModel(BaseModel):
     model_config = ConfigDict(from_attributes=True)
@@ -60,6 +72,27 @@ class Message(Base):
     created_at = Column(BigInteger)  # time_ns
     updated_at = Column(BigInteger)  # time_ns
 
+    __table_args__ = (
+        # WHERE channel_id = ... AND parent_id ... ORDER BY created_at DESC
+        Index(
+            "message_channel_id_parent_id_created_at_idx",
+            "channel_id",
+            "parent_id",
+            "created_at",
+        ),
+        # WHERE parent_id = ... ORDER BY created_at DESC
+        Index("message_parent_id_created_at_idx", "parent_id", "created_at"),
+        # WHERE channel_id = ... AND is_pinned ORDER BY pinned_at DESC, only
+        # the few pinned rows are indexed
+        Index(
+            "message_channel_id_pinned_at_idx",
+            "channel_id",
+            "pinned_at",
+            postgresql_where=is_pinned == true(),
+            sqlite_where=is_pinned == true(),
+        ),
+    )
+
 
 class MessageModel(BaseModel):
     model_config = ConfigDict(from_attributes=True)
@@ -135,9 +168,19 @@ class MessageResponse(MessageReplyToResponse):
     reactions: list[Reactions]
 
 
+def _get_message_values(message: Message) -> dict:
+    # Rows read back from the message table already match MessageModel, so
+    # copy the columns over instead of validating and dumping each one
+    return {field: getattr(message, field) for field in MessageModel.model_fields}
+
+
 class MessageTable:
     def insert_new_message(
-        self, form_data: MessageForm, channel_id: str, user_id: str
+        self,
+        form_data: MessageForm,
+        channel_id: str,
+        user_id: str,
+        activate_members: bool = False,
     ) -> Optional[MessageModel]:
         with get_db() as db:
             channel_member = Channels.join_channel(channel_id, user_id)
@@ -162,12 +205,25 @@ class MessageTable:
                     "updated_at": ts,
                 }
             )
-            result = Message(**message.model_dump())
+            db.add(Message(**message.model_dump()))
+
+            if activate_members:
+                # Bring members who hid the conversation back in the same
+                # transaction as the message instead of one commit per member
+                db.query(ChannelMember).filter(
+                    ChannelMember.channel_id == channel_id,
+                    or_(
+                        ChannelMember.is_active == False,
+                        ChannelMember.is_active == None,
+                    ),
+                ).update(
+                    {"is_active": True, "updated_at": ts},
+                    synchronize_session=False,
+                )
 
-            db.add(result)
             db.commit()
-            db.refresh(result)
-            return MessageModel.model_validate(result) if result else None
+            # Every column was set above, no need to read the row back
+            return message
 
     def get_message_by_id(self, id: str) -> Optional[MessageResponse]:
         with get_db() as db:
@@ -187,7 +243,7 @@ class MessageTable:
             user = Users.get_user_by_id(message.user_id)
             return MessageResponse.model_validate(
                 {
-                    **MessageModel.model_validate(message).model_dump(),
+                    **_get_message_values(message),
                     "user": user.model_dump() if user else None,
                     "reply_to_message": (
                         reply_to_message.model_dump() if reply_to_message else None
@@ -219,7 +275,7 @@ class MessageTable:
                 messages.append(
                     MessageReplyToResponse.model_validate(
                         {
-                            **MessageModel.model_validate(message).model_dump(),
+                            **_get_message_values(message),
                             "reply_to_message": (
                                 reply_to_message.model_dump()
                                 if reply_to_message
@@ -237,18 +293,44 @@ class MessageTable:
                 for message in db.query(Message).filter_by(parent_id=id).all()
             ]
 
+    def _paginate_messages(
+        self,
+        query,
+        skip: int,
+        limit: int,
+        cursor_created_at: Optional[int] = None,
+        cursor_id: Optional[str] = None,
+    ):
+        # Keyset pagination: continue after the last (created_at, id) seen so
+        # the index range seek replaces rescanning skipped rows; the id breaks
+        # ties between messages sent in the same nanosecond
+        if cursor_created_at is not None and cursor_id is not None:
+            query = query.filter(
+                tuple_(Message.created_at, Message.id) < (cursor_created_at, cursor_id)
+            )
+
+        return (
+            query.order_by(Message.created_at.desc(), Message.id.desc())
+            .offset(skip)
+            .limit(limit)
+        )
+
     def get_messages_by_channel_id(
-        self, channel_id: str, skip: int = 0, limit: int = 50
+        self,
+        channel_id: str,
+        skip: int = 0,
+        limit: int = 50,
+        cursor_created_at: Optional[int] = None,
+        cursor_id: Optional[str] = None,
     ) -> list[MessageReplyToResponse]:
         with get_db() as db:
-            all_messages = (
-                db.query(Message)
-                .filter_by(channel_id=channel_id, parent_id=None)
-                .order_by(Message.created_at.desc())
-                .offset(skip)
-                .limit(limit)
-                .all()
-            )
+            all_messages = self._paginate_messages(
+                db.query(Message).filter_by(channel_id=channel_id, parent_id=None),
+                skip,
+                limit,
+                cursor_created_at,
+                cursor_id,
+            ).all()
 
             messages = []
             for message in all_messages:
@@ -260,7 +342,7 @@ class MessageTable:
                 messages.append(
                     MessageReplyToResponse.model_validate(
                         {
-                            **MessageModel.model_validate(message).model_dump(),
+                            **_get_message_values(message),
                             "reply_to_message": (
                                 reply_to_message.model_dump()
                                 if reply_to_message
@@ -272,7 +354,13 @@ class MessageTable:
             return messages
 
     def get_messages_by_parent_id(
-        self, channel_id: str, parent_id: str, skip: int = 0, limit: int = 50
+        self,
+        channel_id: str,
+        parent_id: str,
+        skip: int = 0,
+        limit: int = 50,
+        cursor_created_at: Optional[int] = None,
+        cursor_id: Optional[str] = None,
     ) -> list[MessageReplyToResponse]:
         with get_db() as db:
             message = db.get(Message, parent_id)
@@ -280,14 +368,13 @@ class MessageTable:
             if not message:
                 return []
 
-            all_messages = (
-                db.query(Message)
-                .filter_by(channel_id=channel_id, parent_id=parent_id)
-                .order_by(Message.created_at.desc())
-                .offset(skip)
-                .limit(limit)
-                .all()
-            )
+            all_messages = self._paginate_messages(
+                db.query(Message).filter_by(channel_id=channel_id, parent_id=parent_id),
+                skip,
+                limit,
+                cursor_created_at,
+                cursor_id,
+            ).all()
 
             # If length of all_messages is less than limit, then add the parent message
             if len(all_messages) < limit:
@@ -303,7 +390,7 @@ class MessageTable:
                 messages.append(
                     MessageReplyToResponse.model_validate(
                         {
-                            **MessageModel.model_validate(message).model_dump(),
+                            **_get_message_values(message),
                             "reply_to_message": (
                                 reply_to_message.model_dump()
                                 if reply_to_message
@@ -322,7 +409,23 @@ class MessageTable:
                 .order_by(Message.created_at.desc())
                 .first()
             )
-            return MessageModel.model_validate(message) if message else None
+            return (
+                MessageModel.model_construct(**_get_message_values(message))
+                if message
+                else None
+            )
+
+    def get_last_message_at_by_channel_ids(
+        self, channel_ids: list[str]
+    ) -> dict[str, int]:
+        with get_db() as db:
+            rows = (
+                db.query(Message.channel_id, func.max(Message.created_at))
+                .filter(Message.channel_id.in_(channel_ids))
+                .group_by(Message.channel_id)
+                .all()
+            )
+            return {channel_id: created_at for channel_id, created_at in rows}
 
     def get_pinned_messages_by_channel_id(
         self, channel_id: str, skip: int = 0, limit: int = 50
@@ -336,7 +439,10 @@ class MessageTable:
                 .limit(limit)
                 .all()
             )
-            return [MessageModel.model_validate(message) for message in all_messages]
+            return [
+                MessageModel.model_construct(**_get_message_values(message))
+                for message in all_messages
+            ]
 
     def update_message_by_id(
         self, id: str, form_data: MessageForm
@@ -354,7 +460,8 @@ class MessageTable:
             }
             message.updated_at = int(time.time_ns())
             db.commit()
-            db.refresh(message)
+            # Sessions don't expire on commit, so the row is still loaded;
+            # skip the refresh SELECT
             return MessageModel.model_validate(message) if message else None
 
     def update_is_pinned_by_id(
@@ -366,7 +473,6 @@ class MessageTable:
             message.pinned_at = int(time.time_ns()) if is_pinned else None
             message.pinned_by = pinned_by if is_pinned else None
             db.commit()
-            db.refresh(message)
             return MessageModel.model_validate(message) if message else None
 
     def get_unread_message_count(
@@ -385,29 +491,42 @@ class MessageTable:
     def add_reaction_to_message(
         self, id: str, user_id: str, name: str
     ) -> Optional[MessageReactionModel]:
+        """Returns the new reaction, or None if the user already reacted."""
         with get_db() as db:
-            # check for existing reaction
-            existing_reaction = (
-                db.query(MessageReaction)
-                .filter_by(message_id=id, user_id=user_id, name=name)
-                .first()
-            )
-            if existing_reaction:
-                return MessageReactionModel.model_validate(existing_reaction)
-
-            reaction_id = str(uuid.uuid4())
             reaction = MessageReactionModel(
-                id=reaction_id,
+                id=uuid.uuid4().hex,
                 user_id=user_id,
                 message_id=id,
                 name=name,
                 created_at=int(time.time_ns()),
             )
-            result = MessageReaction(**reaction.model_dump())
-            db.add(result)
+
+            dialect = db.bind.dialect.name
+            if dialect in ("postgresql", "sqlite"):
+                # Let the unique index reject repeated or concurrent requests
+                # in the insert itself instead of checking with a SELECT first
+                insert = postgresql.insert if dialect == "postgresql" else sqlite.insert
+                result = db.execute(
+                    insert(MessageReaction)
+                    .values(**reaction.model_dump())
+                    .on_conflict_do_nothing(
+                        index_elements=["message_id", "user_id", "name"]
+                    )
+                )
+                db.commit()
+                return reaction if result.rowcount else None
+
+            existing_reaction = (
+                db.query(MessageReaction.id)
+                .filter_by(message_id=id, user_id=user_id, name=name)
+                .first()
+            )
+            if existing_reaction:
+                return None
+
+            db.add(MessageReaction(**reaction.model_dump()))
             db.commit()
-            db.refresh(result)
-            return MessageReactionModel.model_validate(result) if result else None
+            return reaction
 
     def get_reactions_by_message_id(self, id: str) -> list[Reactions]:
         with get_db() as db:
@@ -471,5 +590,33 @@ class MessageTable:
             db.commit()
             return True
 
+    def delete_messages_by_channel_id(
+        self, channel_id: str, batch_size: int = 1000
+    ) -> bool:
+        # Delete in bounded batches so a large channel doesn't hold locks or
+        # build up one huge transaction
+        with get_db() as db:
+            while True:
+                message_ids = [
+                    message_id
+                    for (message_id,) in db.query(Message.id)
+                    .filter(Message.channel_id == channel_id)
+                    .limit(batch_size)
+                ]
+                if not message_ids:
+                    break
+
+                db.query(MessageReaction).filter(
+                    MessageReaction.message_id.in_(message_ids)
+                ).delete(synchronize_session=False)
+                db.query(Message).filter(Message.id.in_(message_ids)).delete(
+                    synchronize_session=False
+                )
+                db.commit()
+
+                if len(message_ids) < batch_size:
+                    break
+            return True
+
 
 Messages = MessageTable()
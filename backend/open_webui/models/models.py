@@ -4,8 +4,7 @@ from typing import Optional
 
 from open_webui.internal.db import Base, JSONField, get_db
 
-from open_webui.models.groups import Groups
-from open_webui.models.users import User, UserModel, Users, UserResponse
+from open_webui.models.users import User, UserModel, UserResponse, get_rows_with_users
 
 
 from pydantic import BaseModel, ConfigDict
@@ -17,7 +16,7 @@ from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy import BigInteger, Column, Text, JSON, Boolean
 
 
-from open_webui.utils.access_control import has_access
+from open_webui.utils.db.access_control import get_accessible_rows
 
 
 log = logging.getLogger(__name__)
@@ -152,12 +151,13 @@ class ModelsTable:
     def insert_new_model(
         self, form_data: ModelForm, user_id: str
     ) -> Optional[ModelModel]:
+        now = int(time.time())
         model = ModelModel(
             **{
                 **form_data.model_dump(),
                 "user_id": user_id,
-                "created_at": int(time.time()),
-                "updated_at": int(time.time()),
+                "created_at": now,
+                "updated_at": now,
             }
         )
         try:
@@ -181,25 +181,13 @@ class ModelsTable:
 
     def get_models(self) -> list[ModelUserResponse]:
         with get_db() as db:
-            all_models = db.query(Model).filter(Model.base_model_id != None).all()
-
-            user_ids = list(set(model.user_id for model in all_models))
-
-            users = Users.get_users_by_user_ids(user_ids) if user_ids else []
-            users_dict = {user.id: user for user in users}
-
-            models = []
-            for model in all_models:
-                user = users_dict.get(model.user_id)
-                models.append(
-                    ModelUserResponse.model_validate(
-                        {
-                            **ModelModel.model_validate(model).model_dump(),
-                            "user": user.model_dump() if user else None,
-                        }
-                    )
-                )
-            return models
+            items = (
+                db.query(Model, User)
+                .outerjoin(User, User.id == Model.user_id)
+                .filter(Model.base_model_id != None)
+                .all()
+            )
+            return get_rows_with_users(items, ModelModel, ModelUserResponse)
 
     def get_base_models(self) -> list[ModelModel]:
         with get_db() as db:
@@ -211,14 +199,16 @@ class ModelsTable:
     def get_models_by_user_id(
         self, user_id: str, permission: str = "write"
     ) -> list[ModelUserResponse]:
-        models = self.get_models()
-        user_group_ids = {group.id for group in Groups.get_groups_by_member_id(user_id)}
-        return [
-            model
-            for model in models
-            if model.user_id == user_id
-            or has_access(user_id, permission, model.access_control, user_group_ids)
-        ]
+        with get_db() as db:
+            items = get_accessible_rows(
+                db.query(Model, User)
+                .outerjoin(User, User.id == Model.user_id)
+                .filter(Model.base_model_id != None),
+                Model,
+                user_id,
+                permission,
+            )
+            return get_rows_with_users(items, ModelModel, ModelUserResponse)
 
     def _has_permission(self, db, query, filter: dict, permission: str = "read"):
         group_ids = filter.get("group_ids", [])
@@ -368,7 +358,7 @@ class ModelsTable:
     def toggle_model_by_id(self, id: str) -> Optional[ModelModel]:
         with get_db() as db:
             try:
-                is_active = db.query(Model).filter_by(id=id).first().is_active
+                is_active = db.get(Model, id).is_active
 
                 db.query(Model).filter_by(id=id).update(
                     {
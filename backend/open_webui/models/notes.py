@@ -216,21 +216,20 @@ class NoteTable:
         user_id: str,
     ) -> Optional[NoteModel]:
         with get_db() as db:
-            note = NoteModel(
-                **{
-                    "id": str(uuid.uuid4()),
-                    "user_id": user_id,
-                    **form_data.model_dump(),
-                    "created_at": int(time.time_ns()),
-                    "updated_at": int(time.time_ns()),
-                }
-            )
-
-            new_note = Note(**note.model_dump())
-
-            db.add(new_note)
+            now = int(time.time_ns())
+            # Note data carries the full document, so dump the form once and
+            # build the row from that instead of round-tripping via NoteModel
+            values = {
+                "id": str(uuid.uuid4()),
+                "user_id": user_id,
+                **form_data.model_dump(),
+                "created_at": now,
+                "updated_at": now,
+            }
+
+            db.add(Note(**values))
             db.commit()
-            return note
+            return NoteModel.model_validate(values)
 
     def get_notes(
         self, skip: Optional[int] = None, limit: Optional[int] = None
@@ -337,9 +336,7 @@ class NoteTable:
         limit: Optional[int] = None,
     ) -> list[NoteModel]:
         with get_db() as db:
-            user_group_ids = [
-                group.id for group in Groups.get_groups_by_member_id(user_id)
-            ]
+            user_group_ids = Groups.get_group_ids_by_member_id(user_id)
 
             query = db.query(Note).order_by(Note.updated_at.desc())
             query = self._has_permission(
@@ -356,14 +353,14 @@ class NoteTable:
 
     def get_note_by_id(self, id: str) -> Optional[NoteModel]:
         with get_db() as db:
-            note = db.query(Note).filter(Note.id == id).first()
+            note = db.get(Note, id)
             return NoteModel.model_validate(note) if note else None
 
     def update_note_by_id(
         self, id: str, form_data: NoteUpdateForm
     ) -> Optional[NoteModel]:
         with get_db() as db:
-            note = db.query(Note).filter(Note.id == id).first()
+            note = db.get(Note, id)
             if not note:
                 return None
 
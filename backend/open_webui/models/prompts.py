@@ -2,13 +2,12 @@ import time
 from typing import Optional
 
 from open_webui.internal.db import Base, get_db
-from open_webui.models.groups import Groups
-from open_webui.models.users import Users, UserResponse
+from open_webui.models.users import User, UserResponse, get_rows_with_users
 
 from pydantic import BaseModel, ConfigDict
 from sqlalchemy import BigInteger, Column, String, Text, JSON
 
-from open_webui.utils.access_control import has_access
+from open_webui.utils.db.access_control import get_accessible_rows
 
 ####################
 # Prompts DB Schema
@@ -104,39 +103,27 @@ class PromptsTable:
 
     def get_prompts(self) -> list[PromptUserResponse]:
         with get_db() as db:
-            all_prompts = db.query(Prompt).order_by(Prompt.timestamp.desc()).all()
-
-            user_ids = list(set(prompt.user_id for prompt in all_prompts))
-
-            users = Users.get_users_by_user_ids(user_ids) if user_ids else []
-            users_dict = {user.id: user for user in users}
-
-            prompts = []
-            for prompt in all_prompts:
-                user = users_dict.get(prompt.user_id)
-                prompts.append(
-                    PromptUserResponse.model_validate(
-                        {
-                            **PromptModel.model_validate(prompt).model_dump(),
-                            "user": user.model_dump() if user else None,
-                        }
-                    )
-                )
-
-            return prompts
+            items = (
+                db.query(Prompt, User)
+                .outerjoin(User, User.id == Prompt.user_id)
+                .order_by(Prompt.timestamp.desc())
+                .all()
+            )
+            return get_rows_with_users(items, PromptModel, PromptUserResponse)
 
     def get_prompts_by_user_id(
         self, user_id: str, permission: str = "write"
     ) -> list[PromptUserResponse]:
-        prompts = self.get_prompts()
-        user_group_ids = {group.id for group in Groups.get_groups_by_member_id(user_id)}
-
-        return [
-            prompt
-            for prompt in prompts
-            if prompt.user_id == user_id
-            or has_access(user_id, permission, prompt.access_control, user_group_ids)
-        ]
+        with get_db() as db:
+            items = get_accessible_rows(
+                db.query(Prompt, User)
+                .outerjoin(User, User.id == Prompt.user_id)
+                .order_by(Prompt.timestamp.desc()),
+                Prompt,
+                user_id,
+                permission,
+            )
+            return get_rows_with_users(items, PromptModel, PromptUserResponse)
 
     def update_prompt_by_command(
         self, command: str, form_data: PromptForm
@@ -3,13 +3,12 @@ import time
 from typing import Optional
 
 from open_webui.internal.db import Base, JSONField, get_db
-from open_webui.models.users import Users, UserResponse
-from open_webui.models.groups import Groups
+from open_webui.models.users import User, Users, UserResponse, get_rows_with_users
 
 from pydantic import BaseModel, ConfigDict
 from sqlalchemy import BigInteger, Column, String, Text, JSON
 
-from open_webui.utils.access_control import has_access
+from open_webui.utils.db.access_control import get_accessible_rows
 
 
 log = logging.getLogger(__name__)
@@ -113,13 +112,14 @@ class ToolsTable:
         self, user_id: str, form_data: ToolForm, specs: list[dict]
     ) -> Optional[ToolModel]:
         with get_db() as db:
+            now = int(time.time())
             tool = ToolModel(
                 **{
                     **form_data.model_dump(),
                     "specs": specs,
                     "user_id": user_id,
-                    "updated_at": int(time.time()),
-                    "created_at": int(time.time()),
+                    "updated_at": now,
+                    "created_at": now,
                 }
             )
 
@@ -146,38 +146,27 @@ class ToolsTable:
 
     def get_tools(self) -> list[ToolUserModel]:
         with get_db() as db:
-            all_tools = db.query(Tool).order_by(Tool.updated_at.desc()).all()
-
-            user_ids = list(set(tool.user_id for tool in all_tools))
-
-            users = Users.get_users_by_user_ids(user_ids) if user_ids else []
-            users_dict = {user.id: user for user in users}
-
-            tools = []
-            for tool in all_tools:
-                user = users_dict.get(tool.user_id)
-                tools.append(
-                    ToolUserModel.model_validate(
-                        {
-                            **ToolModel.model_validate(tool).model_dump(),
-                            "user": user.model_dump() if user else None,
-                        }
-                    )
-                )
-            return tools
+            items = (
+                db.query(Tool, User)
+                .outerjoin(User, User.id == Tool.user_id)
+                .order_by(Tool.updated_at.desc())
+                .all()
+            )
+            return get_rows_with_users(items, ToolModel, ToolUserModel)
 
     def get_tools_by_user_id(
         self, user_id: str, permission: str = "write"
     ) -> list[ToolUserModel]:
-        tools = self.get_tools()
-        user_group_ids = {group.id for group in Groups.get_groups_by_member_id(user_id)}
-
-        return [
-            tool
-            for tool in tools
-            if tool.user_id == user_id
-            or has_access(user_id, permission, tool.access_control, user_group_ids)
-        ]
+        with get_db() as db:
+            items = get_accessible_rows(
+                db.query(Tool, User)
+                .outerjoin(User, User.id == Tool.user_id)
+                .order_by(Tool.updated_at.desc()),
+                Tool,
+                user_id,
+                permission,
+            )
+            return get_rows_with_users(items, ToolModel, ToolUserModel)
 
     def get_tool_valves_by_id(self, id: str) -> Optional[dict]:
         try:
@@ -234,6 +234,24 @@ class UserUpdateForm(BaseModel):
     password: Optional[str] = None
 
 
+def get_rows_with_users(
+    items, model: type[BaseModel], response_model: type[BaseModel]
+) -> list:
+    """
+    Build response_model objects from the (row, User) pairs of a query that
+    outer-joins each row's owner, with user set to None for a missing owner.
+    """
+    return [
+        response_model.model_validate(
+            {
+                **model.model_validate(row).model_dump(),
+                "user": UserModel.model_validate(user).model_dump() if user else None,
+            }
+        )
+        for row, user in items
+    ]
+
+
 class UsersTable:
     def insert_new_user(
         self,
@@ -245,6 +263,7 @@ class UsersTable:
         oauth: Optional[dict] = None,
     ) -> Optional[UserModel]:
         with get_db() as db:
+            now = int(time.time())
             user = UserModel(
                 **{
                     "id": id,
@@ -252,9 +271,9 @@ class UsersTable:
                     "name": name,
                     "role": role,
                     "profile_image_url": profile_image_url,
-                    "last_active_at": int(time.time()),
-                    "created_at": int(time.time()),
-                    "updated_at": int(time.time()),
+                    "last_active_at": now,
+                    "created_at": now,
+                    "updated_at": now,
                     "oauth": oauth,
                 }
             )
@@ -270,7 +289,7 @@ class UsersTable:
     def get_user_by_id(self, id: str) -> Optional[UserModel]:
         try:
             with get_db() as db:
-                user = db.query(User).filter_by(id=id).first()
+                user = db.get(User, id)
                 return UserModel.model_validate(user)
         except Exception:
             return None
@@ -486,7 +505,7 @@ class UsersTable:
     def get_user_webhook_url_by_id(self, id: str) -> Optional[str]:
         try:
             with get_db() as db:
-                user = db.query(User).filter_by(id=id).first()
+                user = db.get(User, id)
 
                 if user.settings is None:
                     return None
@@ -513,7 +532,7 @@ class UsersTable:
             with get_db() as db:
                 db.query(User).filter_by(id=id).update({"role": role})
                 db.commit()
-                user = db.query(User).filter_by(id=id).first()
+                user = db.get(User, id)
                 return UserModel.model_validate(user)
         except Exception:
             return None
@@ -528,7 +547,7 @@ class UsersTable:
                 )
                 db.commit()
 
-                user = db.query(User).filter_by(id=id).first()
+                user = db.get(User, id)
                 return UserModel.model_validate(user)
         except Exception:
             return None
@@ -543,24 +562,23 @@ class UsersTable:
                 )
                 db.commit()
 
-                user = db.query(User).filter_by(id=id).first()
+                user = db.get(User, id)
                 return UserModel.model_validate(user)
         except Exception:
             return None
 
     @throttle(DATABASE_USER_ACTIVE_STATUS_UPDATE_INTERVAL)
-    def update_last_active_by_id(self, id: str) -> Optional[UserModel]:
+    def update_last_active_by_id(self, id: str) -> None:
+        # Called on every authenticated request and socket heartbeat; callers
+        # never use the row, so skip reading it back after the UPDATE.
         try:
             with get_db() as db:
                 db.query(User).filter_by(id=id).update(
                     {"last_active_at": int(time.time())}
                 )
                 db.commit()
-
-                user = db.query(User).filter_by(id=id).first()
-                return UserModel.model_validate(user)
         except Exception:
-            return None
+            pass
 
     def update_user_oauth_by_id(
         self, id: str, provider: str, sub: str
@@ -575,7 +593,7 @@ class UsersTable:
         """
         try:
             with get_db() as db:
-                user = db.query(User).filter_by(id=id).first()
+                user = db.get(User, id)
                 if not user:
                     return None
 
@@ -600,7 +618,7 @@ class UsersTable:
                 db.query(User).filter_by(id=id).update(updated)
                 db.commit()
 
-                user = db.query(User).filter_by(id=id).first()
+                user = db.get(User, id)
                 return UserModel.model_validate(user)
                 # return UserModel(**user.dict())
         except Exception as e:
@@ -610,7 +628,7 @@ class UsersTable:
     def update_user_settings_by_id(self, id: str, updated: dict) -> Optional[UserModel]:
         try:
             with get_db() as db:
-                user_settings = db.query(User).filter_by(id=id).first().settings
+                user_settings = db.get(User, id).settings
 
                 if user_settings is None:
                     user_settings = {}
@@ -620,7 +638,7 @@ class UsersTable:
                 db.query(User).filter_by(id=id).update({"settings": user_settings})
                 db.commit()
 
-                user = db.query(User).filter_by(id=id).first()
+                user = db.get(User, id)
                 return UserModel.model_validate(user)
         except Exception:
             return None
@@ -2,6 +2,7 @@ import hashlib
 import json
 import logging
 import os
+import shutil
 import uuid
 import html
 import base64
@@ -1166,14 +1167,15 @@ def transcription(
         id = uuid.uuid4()
 
         filename = f"{id}.{ext}"
-        contents = file.file.read()
 
         file_dir = f"{CACHE_DIR}/audio/transcriptions"
         os.makedirs(file_dir, exist_ok=True)
         file_path = f"{file_dir}/{filename}"
 
+        # Copy the upload to disk in chunks rather than reading the whole
+        # recording into memory first
         with open(file_path, "wb") as f:
-            f.write(contents)
+            shutil.copyfileobj(file.file, f)
 
         try:
             metadata = None
@@ -55,6 +55,7 @@ from open_webui.utils.auth import (
     decode_token,
     invalidate_token,
     create_api_key,
+    invalidate_api_key,
     create_token,
     get_admin_user,
     get_verified_user,
@@ -1158,9 +1159,13 @@ async def generate_api_key(request: Request, user=Depends(get_current_user)):
             detail=ERROR_MESSAGES.API_KEY_CREATION_NOT_ALLOWED,
         )
 
+    old_api_key = Users.get_user_api_key_by_id(user.id)
+
     api_key = create_api_key()
     success = Users.update_user_api_key_by_id(user.id, api_key)
 
+    await invalidate_api_key(request, old_api_key)
+
     if success:
         return {
             "api_key": api_key,
@@ -1171,8 +1176,11 @@ async def generate_api_key(request: Request, user=Depends(get_current_user)):
 
 # delete api key
 @router.delete("/api_key", response_model=bool)
-async def delete_api_key(user=Depends(get_current_user)):
-    return Users.delete_user_api_key_by_id(user.id)
+async def delete_api_key(request: Request, user=Depends(get_current_user)):
+    old_api_key = Users.get_user_api_key_by_id(user.id)
+    result = Users.delete_user_api_key_by_id(user.id)
+    await invalidate_api_key(request, old_api_key)
+    return result
 
 
 # get api key
@@ -4,10 +4,12 @@ from typing import Optional
 
 
 from fastapi import APIRouter, Depends, HTTPException, Request, status, BackgroundTasks
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel
 from pydantic import field_validator
 
 from open_webui.socket.main import (
+    emit_nowait,
     emit_to_users,
     enter_room_for_users,
     sio,
@@ -109,12 +111,22 @@ async def get_channels(
         )
 
     channels = Channels.get_channels_by_user_id(user.id)
+    channel_ids = [channel.id for channel in channels]
+
+    # Resolve last message times and the user's memberships for all channels
+    # up front instead of two queries per channel
+    last_message_at_by_channel_id = Messages.get_last_message_at_by_channel_ids(
+        channel_ids
+    )
+    members_by_channel_id = Channels.get_members_by_user_id_and_channel_ids(
+        user.id, channel_ids
+    )
+
     channel_list = []
     for channel in channels:
-        last_message = Messages.get_last_message_by_channel_id(channel.id)
-        last_message_at = last_message.created_at if last_message else None
+        last_message_at = last_message_at_by_channel_id.get(channel.id)
 
-        channel_member = Channels.get_member_by_channel_and_user_id(channel.id, user.id)
+        channel_member = members_by_channel_id.get(channel.id)
         unread_count = (
             Messages.get_unread_message_count(
                 channel.id, user.id, channel_member.last_read_at
@@ -329,7 +341,7 @@ async def get_channel_by_id(
     user=Depends(get_verified_user),
 ):
     check_channels_access(request)
-    channel = Channels.get_channel_by_id(id)
+    channel, is_member = Channels.get_channel_with_membership_by_id(id, user.id)
     if not channel:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail=ERROR_MESSAGES.NOT_FOUND
@@ -339,7 +351,7 @@ async def get_channel_by_id(
     users = None
 
     if channel.type in ["group", "dm"]:
-        if not Channels.is_user_channel_member(channel.id, user.id):
+        if not is_member:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN, detail=ERROR_MESSAGES.DEFAULT()
             )
@@ -425,7 +437,7 @@ async def get_channel_members_by_id(
 ):
     check_channels_access(request)
 
-    channel = Channels.get_channel_by_id(id)
+    channel, is_member = Channels.get_channel_with_membership_by_id(id, user.id)
     if not channel:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail=ERROR_MESSAGES.NOT_FOUND
@@ -437,7 +449,7 @@ async def get_channel_members_by_id(
     skip = (page - 1) * limit
 
     if channel.type in ["group", "dm"]:
-        if not Channels.is_user_channel_member(channel.id, user.id):
+        if not is_member:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN, detail=ERROR_MESSAGES.DEFAULT()
             )
@@ -512,13 +524,13 @@ async def update_is_active_member_by_id_and_user_id(
     user=Depends(get_verified_user),
 ):
     check_channels_access(request)
-    channel = Channels.get_channel_by_id(id)
+    channel, is_member = Channels.get_channel_with_membership_by_id(id, user.id)
     if not channel:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail=ERROR_MESSAGES.NOT_FOUND
         )
 
-    if not Channels.is_user_channel_member(channel.id, user.id):
+    if not is_member:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail=ERROR_MESSAGES.NOT_FOUND
         )
@@ -675,6 +687,7 @@ async def update_channel_by_id(
 async def delete_channel_by_id(
     request: Request,
     id: str,
+    background_tasks: BackgroundTasks,
     user=Depends(get_verified_user),
 ):
     check_channels_access(request)
@@ -699,6 +712,9 @@ async def delete_channel_by_id(
 
     try:
         Channels.delete_channel_by_id(id)
+        # The channel is gone for clients already; clear out its messages in
+        # batches after the response is sent
+        background_tasks.add_task(Messages.delete_messages_by_channel_id, id)
         return True
     except Exception as e:
         log.exception(e)
@@ -731,17 +747,26 @@ async def get_channel_messages(
     id: str,
     skip: int = 0,
     limit: int = 50,
+    cursor_created_at: Optional[int] = None,
+    cursor_id: Optional[str] = None,
     user=Depends(get_verified_user),
 ):
     check_channels_access(request)
-    channel = Channels.get_channel_by_id(id)
+    # Pass the created_at and id of the oldest message received as the cursor
+    # to fetch the next page
+    if (cursor_created_at is None) != (cursor_id is None):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=ERROR_MESSAGES.INCOMPLETE_CURSOR("cursor_created_at and cursor_id"),
+        )
+    channel, is_member = Channels.get_channel_with_membership_by_id(id, user.id)
     if not channel:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail=ERROR_MESSAGES.NOT_FOUND
         )
 
     if channel.type in ["group", "dm"]:
-        if not Channels.is_user_channel_member(channel.id, user.id):
+        if not is_member:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN, detail=ERROR_MESSAGES.DEFAULT()
             )
@@ -757,15 +782,22 @@ async def get_channel_messages(
             id, user.id
         )  # Ensure user is a member of the channel
 
-    message_list = Messages.get_messages_by_channel_id(id, skip, limit)
-    users = {}
+    message_list = Messages.get_messages_by_channel_id(
+        id,
+        skip=skip,
+        limit=limit,
+        cursor_created_at=cursor_created_at,
+        cursor_id=cursor_id,
+    )
+    users = {
+        message_user.id: message_user
+        for message_user in Users.get_users_by_user_ids(
+            list({message.user_id for message in message_list})
+        )
+    }
 
     messages = []
     for message in message_list:
-        if message.user_id not in users:
-            user = Users.get_user_by_id(message.user_id)
-            users[message.user_id] = user
-
         thread_replies = Messages.get_thread_replies_by_message_id(message.id)
         latest_thread_reply_at = (
             thread_replies[0].created_at if thread_replies else None
@@ -801,14 +833,14 @@ async def get_pinned_channel_messages(
     user=Depends(get_verified_user),
 ):
     check_channels_access(request)
-    channel = Channels.get_channel_by_id(id)
+    channel, is_member = Channels.get_channel_with_membership_by_id(id, user.id)
     if not channel:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail=ERROR_MESSAGES.NOT_FOUND
         )
 
     if channel.type in ["group", "dm"]:
-        if not Channels.is_user_channel_member(channel.id, user.id):
+        if not is_member:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN, detail=ERROR_MESSAGES.DEFAULT()
             )
@@ -825,14 +857,15 @@ async def get_pinned_channel_messages(
     limit = PAGE_ITEM_COUNT_PINNED
 
     message_list = Messages.get_pinned_messages_by_channel_id(id, skip, limit)
-    users = {}
+    users = {
+        message_user.id: message_user
+        for message_user in Users.get_users_by_user_ids(
+            list({message.user_id for message in message_list})
+        )
+    }
 
     messages = []
     for message in message_list:
-        if message.user_id not in users:
-            user = Users.get_user_by_id(message.user_id)
-            users[message.user_id] = user
-
         messages.append(
             MessageWithReactionsResponse(
                 **{
@@ -854,6 +887,16 @@ async def get_pinned_channel_messages(
 async def send_notification(name, webui_url, channel, message, active_user_ids):
     users = get_users_with_access("read", channel.access_control)
 
+    # Same payload for every recipient, build it once
+    channel_url = f"{webui_url}/channels/{channel.id}"
+    notification = f"#{channel.name} - {channel_url}\n\n{message.content}"
+    event_data = {
+        "action": "channel",
+        "message": message.content,
+        "title": channel.name,
+        "url": channel_url,
+    }
+
     for user in users:
         if (user.id not in active_user_ids) and Channels.is_user_channel_member(
             channel.id, user.id
@@ -866,24 +909,25 @@ async def send_notification(name, webui_url, channel, message, active_user_ids):
                     await post_webhook(
                         name,
                         webhook_url,
-                        f"#{channel.name} - {webui_url}/channels/{channel.id}\n\n{message.content}",
-                        {
-                            "action": "channel",
-                            "message": message.content,
-                            "title": channel.name,
-                            "url": f"{webui_url}/channels/{channel.id}",
-                        },
+                        notification,
+                        event_data,
                     )
 
     return True
 
 
-async def model_response_handler(request, channel, message, user):
-    MODELS = {
-        model["id"]: model
-        for model in get_filtered_models(await get_all_models(request, user=user), user)
-    }
+MODEL_RESPONSE_SYSTEM_PROMPT = (
+    "You are {name}, participating in a threaded conversation. "
+    "Be concise and conversational."
+)
+MODEL_RESPONSE_THREAD_PROMPT = (
+    "Here's the thread history:\n\n\n{history}\n\n\n"
+    "Continue the conversation naturally as {name}, addressing the most recent "
+    "message while being aware of the full context."
+)
 
+
+async def model_response_handler(request, channel, message, user):
     mentions = extract_mentions(message.content)
     message_content = replace_mentions(message.content)
 
@@ -906,11 +950,30 @@ async def model_response_handler(request, channel, message, user):
     if not model_mentions:
         return False
 
+    # Look the mentioned models up in the models already loaded into app
+    # state, only listing them from the connections when nothing is loaded yet
+    if not request.app.state.MODELS:
+        await get_all_models(request, user=user)
+
+    mentioned_models = [
+        model
+        for model_id in model_mentions
+        if (model := request.app.state.MODELS.get(model_id))
+    ]
+    MODELS = {
+        model["id"]: model for model in get_filtered_models(mentioned_models, user)
+    }
+
+    if not MODELS:
+        log.debug(f"No available models mentioned in message {message.id}")
+        return False
+
     for mention in model_mentions.values():
         model_id = mention["id"]
         model = MODELS.get(model_id, None)
 
         if model:
+            model_name = model.get("name", model_id)
             try:
                 # reverse to get in chronological order
                 thread_messages = Messages.get_messages_by_parent_id(
@@ -930,7 +993,7 @@ async def model_response_handler(request, channel, message, user):
                             "data": {},
                             "meta": {
                                 "model_id": model_id,
-                                "model_name": model.get("name", model_id),
+                                "model_name": model_name,
                             },
                         }
                     ),
@@ -958,7 +1021,7 @@ async def model_response_handler(request, channel, message, user):
                         username = (
                             message_model.get("name", message_model_id)
                             if message_model
-                            else message_model_id
+                            else thread_message.meta.get("model_name", message_model_id)
                         )
                     else:
                         username = message_user.name if message_user else "Unknown"
@@ -976,12 +1039,13 @@ async def model_response_handler(request, channel, message, user):
                             if image:
                                 images.append(image)
 
-                thread_history_string = "\n\n".join(thread_history)
                 system_message = {
                     "role": "system",
-                    "content": f"You are {model.get('name', model_id)}, participating in a threaded conversation. Be concise and conversational."
+                    "content": MODEL_RESPONSE_SYSTEM_PROMPT.format(name=model_name)
                     + (
-                        f"Here's the thread history:\n\n\n{thread_history_string}\n\n\nContinue the conversation naturally as {model.get('name', model_id)}, addressing the most recent message while being aware of the full context."
+                        MODEL_RESPONSE_THREAD_PROMPT.format(
+                            name=model_name, history="\n\n".join(thread_history)
+                        )
                         if thread_history
                         else ""
                     ),
@@ -1056,17 +1120,32 @@ async def model_response_handler(request, channel, message, user):
     return True
 
 
+def insert_channel_message(
+    channel, form_data: MessageForm, user_id: str
+) -> Optional[MessageResponse]:
+    message = Messages.insert_new_message(
+        form_data,
+        channel.id,
+        user_id,
+        activate_members=channel.type in ["group", "dm"],
+    )
+    if not message:
+        return None
+
+    return Messages.get_message_by_id(message.id)
+
+
 async def new_message_handler(
     request: Request, id: str, form_data: MessageForm, user=Depends(get_verified_user)
 ):
-    channel = Channels.get_channel_by_id(id)
+    channel, is_member = Channels.get_channel_with_membership_by_id(id, user.id)
     if not channel:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail=ERROR_MESSAGES.NOT_FOUND
         )
 
     if channel.type in ["group", "dm"]:
-        if not Channels.is_user_channel_member(channel.id, user.id):
+        if not is_member:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN, detail=ERROR_MESSAGES.DEFAULT()
             )
@@ -1079,17 +1158,16 @@ async def new_message_handler(
             )
 
     try:
-        message = Messages.insert_new_message(form_data, channel.id, user.id)
+        # Inserting and reloading the message takes several blocking queries,
+        # run them in the threadpool instead of on the event loop
+        message = await run_in_threadpool(
+            insert_channel_message, channel, form_data, user.id
+        )
         if message:
-            if channel.type in ["group", "dm"]:
-                members = Channels.get_members_by_channel_id(channel.id)
-                for member in members:
-                    if not member.is_active:
-                        Channels.update_member_active_status(
-                            channel.id, member.user_id, True
-                        )
+            # Shared by every event emitted below
+            user_data = UserNameResponse(**user.model_dump()).model_dump()
+            channel_data = channel.model_dump()
 
-            message = Messages.get_message_by_id(message.id)
             event_data = {
                 "channel_id": channel.id,
                 "message_id": message.id,
@@ -1097,8 +1175,8 @@ async def new_message_handler(
                     "type": "message",
                     "data": {"temp_id": form_data.temp_id, **message.model_dump()},
                 },
-                "user": UserNameResponse(**user.model_dump()).model_dump(),
-                "channel": channel.model_dump(),
+                "user": user_data,
+                "channel": channel_data,
             }
 
             await sio.emit(
@@ -1109,7 +1187,9 @@ async def new_message_handler(
 
             if message.parent_id:
                 # If this message is a reply, emit to the parent message as well
-                parent_message = Messages.get_message_by_id(message.parent_id)
+                parent_message = await run_in_threadpool(
+                    Messages.get_message_by_id, message.parent_id
+                )
 
                 if parent_message:
                     await sio.emit(
@@ -1121,8 +1201,8 @@ async def new_message_handler(
                                 "type": "message:reply",
                                 "data": parent_message.model_dump(),
                             },
-                            "user": UserNameResponse(**user.model_dump()).model_dump(),
-                            "channel": channel.model_dump(),
+                            "user": user_data,
+                            "channel": channel_data,
                         },
                         to=f"channel:{channel.id}",
                     )
@@ -1148,14 +1228,19 @@ async def post_new_message(
 
     try:
         message, channel = await new_message_handler(request, id, form_data, user)
-        try:
-            if files := message.data.get("files", []):
-                for file in files:
-                    Channels.set_file_message_id_in_channel_by_id(
-                        channel.id, file.get("id", ""), message.id
+
+        # The message is stored and broadcast at this point; link its files
+        # after the response so the sender isn't kept waiting on it
+        def link_message_files():
+            try:
+                if files := message.data.get("files", []):
+                    Channels.set_file_message_id_in_channel_by_ids(
+                        channel.id, [file.get("id", "") for file in files], message.id
                     )
-        except Exception as e:
-            log.debug(e)
+            except Exception as e:
+                log.debug(e)
+
+        background_tasks.add_task(link_message_files)
 
         active_user_ids = get_user_ids_from_room(f"channel:{channel.id}")
 
@@ -1195,14 +1280,14 @@ async def get_channel_message(
     user=Depends(get_verified_user),
 ):
     check_channels_access(request)
-    channel = Channels.get_channel_by_id(id)
+    channel, is_member = Channels.get_channel_with_membership_by_id(id, user.id)
     if not channel:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail=ERROR_MESSAGES.NOT_FOUND
         )
 
     if channel.type in ["group", "dm"]:
-        if not Channels.is_user_channel_member(channel.id, user.id):
+        if not is_member:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN, detail=ERROR_MESSAGES.DEFAULT()
             )
@@ -1248,14 +1333,14 @@ async def get_channel_message_data(
     user=Depends(get_verified_user),
 ):
     check_channels_access(request)
-    channel = Channels.get_channel_by_id(id)
+    channel, is_member = Channels.get_channel_with_membership_by_id(id, user.id)
     if not channel:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail=ERROR_MESSAGES.NOT_FOUND
         )
 
     if channel.type in ["group", "dm"]:
-        if not Channels.is_user_channel_member(channel.id, user.id):
+        if not is_member:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN, detail=ERROR_MESSAGES.DEFAULT()
             )
@@ -1301,14 +1386,14 @@ async def pin_channel_message(
     user=Depends(get_verified_user),
 ):
     check_channels_access(request)
-    channel = Channels.get_channel_by_id(id)
+    channel, is_member = Channels.get_channel_with_membership_by_id(id, user.id)
     if not channel:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail=ERROR_MESSAGES.NOT_FOUND
         )
 
     if channel.type in ["group", "dm"]:
-        if not Channels.is_user_channel_member(channel.id, user.id):
+        if not is_member:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN, detail=ERROR_MESSAGES.DEFAULT()
             )
@@ -1333,15 +1418,8 @@ async def pin_channel_message(
 
     try:
         Messages.update_is_pinned_by_id(message_id, form_data.is_pinned, user.id)
-        message = Messages.get_message_by_id(message_id)
-        return MessageUserResponse(
-            **{
-                **message.model_dump(),
-                "user": UserNameResponse(
-                    **Users.get_user_by_id(message.user_id).model_dump()
-                ),
-            }
-        )
+        # Already carries the author; the response model drops the extra fields
+        return Messages.get_message_by_id(message_id)
     except Exception as e:
         log.exception(e)
         raise HTTPException(
@@ -1363,17 +1441,26 @@ async def get_channel_thread_messages(
     message_id: str,
     skip: int = 0,
     limit: int = 50,
+    cursor_created_at: Optional[int] = None,
+    cursor_id: Optional[str] = None,
     user=Depends(get_verified_user),
 ):
     check_channels_access(request)
-    channel = Channels.get_channel_by_id(id)
+    # Pass the created_at and id of the oldest message received as the cursor
+    # to fetch the next page
+    if (cursor_created_at is None) != (cursor_id is None):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=ERROR_MESSAGES.INCOMPLETE_CURSOR("cursor_created_at and cursor_id"),
+        )
+    channel, is_member = Channels.get_channel_with_membership_by_id(id, user.id)
     if not channel:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail=ERROR_MESSAGES.NOT_FOUND
         )
 
     if channel.type in ["group", "dm"]:
-        if not Channels.is_user_channel_member(channel.id, user.id):
+        if not is_member:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN, detail=ERROR_MESSAGES.DEFAULT()
             )
@@ -1385,15 +1472,23 @@ async def get_channel_thread_messages(
                 status_code=status.HTTP_403_FORBIDDEN, detail=ERROR_MESSAGES.DEFAULT()
             )
 
-    message_list = Messages.get_messages_by_parent_id(id, message_id, skip, limit)
-    users = {}
+    message_list = Messages.get_messages_by_parent_id(
+        id,
+        message_id,
+        skip=skip,
+        limit=limit,
+        cursor_created_at=cursor_created_at,
+        cursor_id=cursor_id,
+    )
+    users = {
+        message_user.id: message_user
+        for message_user in Users.get_users_by_user_ids(
+            list({message.user_id for message in message_list})
+        )
+    }
 
     messages = []
     for message in message_list:
-        if message.user_id not in users:
-            user = Users.get_user_by_id(message.user_id)
-            users[message.user_id] = user
-
         messages.append(
             MessageUserResponse(
                 **{
@@ -1425,7 +1520,7 @@ async def update_message_by_id(
     user=Depends(get_verified_user),
 ):
     check_channels_access(request)
-    channel = Channels.get_channel_by_id(id)
+    channel, is_member = Channels.get_channel_with_membership_by_id(id, user.id)
     if not channel:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail=ERROR_MESSAGES.NOT_FOUND
@@ -1443,7 +1538,7 @@ async def update_message_by_id(
         )
 
     if channel.type in ["group", "dm"]:
-        if not Channels.is_user_channel_member(channel.id, user.id):
+        if not is_member:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN, detail=ERROR_MESSAGES.DEFAULT()
             )
@@ -1479,7 +1574,7 @@ async def update_message_by_id(
                 to=f"channel:{channel.id}",
             )
 
-        return MessageModel(**message.model_dump())
+        return message
     except Exception as e:
         log.exception(e)
         raise HTTPException(
@@ -1505,14 +1600,14 @@ async def add_reaction_to_message(
     user=Depends(get_verified_user),
 ):
     check_channels_access(request)
-    channel = Channels.get_channel_by_id(id)
+    channel, is_member = Channels.get_channel_with_membership_by_id(id, user.id)
     if not channel:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail=ERROR_MESSAGES.NOT_FOUND
         )
 
     if channel.type in ["group", "dm"]:
-        if not Channels.is_user_channel_member(channel.id, user.id):
+        if not is_member:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN, detail=ERROR_MESSAGES.DEFAULT()
             )
@@ -1536,10 +1631,13 @@ async def add_reaction_to_message(
         )
 
     try:
-        Messages.add_reaction_to_message(message_id, user.id, form_data.name)
+        if not Messages.add_reaction_to_message(message_id, user.id, form_data.name):
+            # Already reacted, e.g. a retried request; nothing changed to broadcast
+            return True
+
         message = Messages.get_message_by_id(message_id)
 
-        await sio.emit(
+        emit_nowait(
             "events:channel",
             {
                 "channel_id": channel.id,
@@ -1554,7 +1652,7 @@ async def add_reaction_to_message(
                 "user": UserNameResponse(**user.model_dump()).model_dump(),
                 "channel": channel.model_dump(),
             },
-            to=f"channel:{channel.id}",
+            f"channel:{channel.id}",
         )
 
         return True
@@ -1579,14 +1677,14 @@ async def remove_reaction_by_id_and_user_id_and_name(
     user=Depends(get_verified_user),
 ):
     check_channels_access(request)
-    channel = Channels.get_channel_by_id(id)
+    channel, is_member = Channels.get_channel_with_membership_by_id(id, user.id)
     if not channel:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail=ERROR_MESSAGES.NOT_FOUND
         )
 
     if channel.type in ["group", "dm"]:
-        if not Channels.is_user_channel_member(channel.id, user.id):
+        if not is_member:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN, detail=ERROR_MESSAGES.DEFAULT()
             )
@@ -1616,7 +1714,7 @@ async def remove_reaction_by_id_and_user_id_and_name(
 
         message = Messages.get_message_by_id(message_id)
 
-        await sio.emit(
+        emit_nowait(
             "events:channel",
             {
                 "channel_id": channel.id,
@@ -1631,7 +1729,7 @@ async def remove_reaction_by_id_and_user_id_and_name(
                 "user": UserNameResponse(**user.model_dump()).model_dump(),
                 "channel": channel.model_dump(),
             },
-            to=f"channel:{channel.id}",
+            f"channel:{channel.id}",
         )
 
         return True
@@ -1655,7 +1753,7 @@ async def delete_message_by_id(
     user=Depends(get_verified_user),
 ):
     check_channels_access(request)
-    channel = Channels.get_channel_by_id(id)
+    channel, is_member = Channels.get_channel_with_membership_by_id(id, user.id)
     if not channel:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail=ERROR_MESSAGES.NOT_FOUND
@@ -1673,7 +1771,7 @@ async def delete_message_by_id(
         )
 
     if channel.type in ["group", "dm"]:
-        if not Channels.is_user_channel_member(channel.id, user.id):
+        if not is_member:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN, detail=ERROR_MESSAGES.DEFAULT()
             )
@@ -1694,6 +1792,10 @@ async def delete_message_by_id(
 
     try:
         Messages.delete_message_by_id(message_id)
+
+        user_data = UserNameResponse(**user.model_dump()).model_dump()
+        channel_data = channel.model_dump()
+
         await sio.emit(
             "events:channel",
             {
@@ -1703,11 +1805,11 @@ async def delete_message_by_id(
                     "type": "message:delete",
                     "data": {
                         **message.model_dump(),
-                        "user": UserNameResponse(**user.model_dump()).model_dump(),
+                        "user": user_data,
                     },
                 },
-                "user": UserNameResponse(**user.model_dump()).model_dump(),
-                "channel": channel.model_dump(),
+                "user": user_data,
+                "channel": channel_data,
             },
             to=f"channel:{channel.id}",
         )
@@ -1726,8 +1828,8 @@ async def delete_message_by_id(
                             "type": "message:reply",
                             "data": parent_message.model_dump(),
                         },
-                        "user": UserNameResponse(**user.model_dump()).model_dump(),
-                        "channel": channel.model_dump(),
+                        "user": user_data,
+                        "channel": channel_data,
                     },
                     to=f"channel:{channel.id}",
                 )
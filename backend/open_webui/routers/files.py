@@ -2,12 +2,12 @@ import logging
 import os
 import uuid
 import json
-from fnmatch import fnmatch
 from pathlib import Path
 from typing import Optional
 from urllib.parse import quote
 import asyncio
 
+from aiocache import cached
 from fastapi import (
     BackgroundTasks,
     APIRouter,
@@ -62,9 +62,15 @@ router = APIRouter()
 
 # TODO: Optimize this function to use the knowledge_file table for faster lookups.
 def has_access_to_file(
-    file_id: Optional[str], access_type: str, user=Depends(get_verified_user)
+    file_id: Optional[str],
+    access_type: str,
+    user=Depends(get_verified_user),
+    file: Optional[FileModel] = None,
 ) -> bool:
-    file = Files.get_file_by_id(file_id)
+    # Callers that already loaded the file pass it in to skip the lookup;
+    # otherwise only its meta is needed, not its (possibly large) content
+    if file is None:
+        file = Files.get_file_metadata_by_id(file_id)
     log.debug(f"Checking if user has {access_type} access to file")
     if not file:
         raise HTTPException(
@@ -74,7 +80,7 @@ def has_access_to_file(
 
     # Check if the file is associated with any knowledge bases the user has access to
     knowledge_bases = Knowledges.get_knowledges_by_file_id(file_id)
-    user_group_ids = {group.id for group in Groups.get_groups_by_member_id(user.id)}
+    user_group_ids = set(Groups.get_group_ids_by_member_id(user.id))
     for knowledge_base in knowledge_bases:
         if knowledge_base.user_id == user.id or has_access(
             user.id, access_type, knowledge_base.access_control, user_group_ids
@@ -302,16 +308,31 @@ def upload_file_handler(
 
 
 @router.get("/", response_model=list[FileModelResponse])
-async def list_files(user=Depends(get_verified_user), content: bool = Query(True)):
+async def list_files(
+    user=Depends(get_verified_user),
+    content: bool = Query(True),
+    limit: Optional[int] = Query(None, ge=1),
+    cursor_updated_at: Optional[int] = Query(None),
+    cursor_id: Optional[str] = Query(None),
+):
+    # Pass the updated_at and id of the last file received as the cursor to
+    # fetch the next page
+    if (cursor_updated_at is None) != (cursor_id is None):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=ERROR_MESSAGES.INCOMPLETE_CURSOR("cursor_updated_at and cursor_id"),
+        )
+    pagination = {
+        "cursor_updated_at": cursor_updated_at,
+        "cursor_id": cursor_id,
+        "limit": limit,
+    }
     if user.role == "admin":
-        files = Files.get_files()
+        files = Files.get_files(include_content=content, **pagination)
     else:
-        files = Files.get_files_by_user_id(user.id)
-
-    if not content:
-        for file in files:
-            if "content" in file.data:
-                del file.data["content"]
+        files = Files.get_files_by_user_id(
+            user.id, include_content=content, **pagination
+        )
 
     return files
 
@@ -333,16 +354,12 @@ async def search_files(
     """
     Search for files by filename with support for wildcard patterns.
     """
-    # Get files according to user role
-    if user.role == "admin":
-        files = Files.get_files()
-    else:
-        files = Files.get_files_by_user_id(user.id)
-
-    # Get matching files
-    matching_files = [
-        file for file in files if fnmatch(file.filename.lower(), filename.lower())
-    ]
+    # Get matching files according to user role
+    matching_files = Files.search_files_by_filename(
+        filename,
+        user_id=None if user.role == "admin" else user.id,
+        include_content=content,
+    )
 
     if not matching_files:
         raise HTTPException(
@@ -350,11 +367,6 @@ async def search_files(
             detail="No files found matching the pattern.",
         )
 
-    if not content:
-        for file in matching_files:
-            if "content" in file.data:
-                del file.data["content"]
-
     return matching_files
 
 
@@ -403,7 +415,7 @@ async def get_file_by_id(id: str, user=Depends(get_verified_user)):
     if (
         file.user_id == user.id
         or user.role == "admin"
-        or has_access_to_file(id, "read", user)
+        or has_access_to_file(id, "read", user, file=file)
     ):
         return file
     else:
@@ -413,6 +425,13 @@ async def get_file_by_id(id: str, user=Depends(get_verified_user)):
         )
 
 
+# Every open status stream polls twice a second; clients watching the same
+# file share one read per interval instead of each hitting the database
+@cached(ttl=0.5, key_builder=lambda _, file_id: f"file_process_status_{file_id}")
+async def get_file_process_status_data(file_id: str) -> Optional[dict]:
+    return Files.get_file_status_by_id(file_id)
+
+
 @router.get("/{id}/process/status")
 async def get_file_process_status(
     id: str, stream: bool = Query(False), user=Depends(get_verified_user)
@@ -428,7 +447,7 @@ async def get_file_process_status(
     if (
         file.user_id == user.id
         or user.role == "admin"
-        or has_access_to_file(id, "read", user)
+        or has_access_to_file(id, "read", user, file=file)
     ):
         if stream:
             MAX_FILE_PROCESSING_DURATION = 3600 * 2
@@ -436,9 +455,8 @@ async def get_file_process_status(
             async def event_stream(file_item):
                 if file_item:
                     for _ in range(MAX_FILE_PROCESSING_DURATION):
-                        file_item = Files.get_file_by_id(file_item.id)
-                        if file_item:
-                            data = file_item.model_dump().get("data", {})
+                        data = await get_file_process_status_data(file_item.id)
+                        if data:
                             status = data.get("status")
 
                             if status:
@@ -488,7 +506,7 @@ async def get_file_data_content_by_id(id: str, user=Depends(get_verified_user)):
     if (
         file.user_id == user.id
         or user.role == "admin"
-        or has_access_to_file(id, "read", user)
+        or has_access_to_file(id, "read", user, file=file)
     ):
         return {"content": file.data.get("content", "")}
     else:
@@ -522,7 +540,7 @@ async def update_file_data_content_by_id(
     if (
         file.user_id == user.id
         or user.role == "admin"
-        or has_access_to_file(id, "write", user)
+        or has_access_to_file(id, "write", user, file=file)
     ):
         try:
             process_file(
@@ -563,7 +581,7 @@ async def get_file_content_by_id(
     if (
         file.user_id == user.id
         or user.role == "admin"
-        or has_access_to_file(id, "read", user)
+        or has_access_to_file(id, "read", user, file=file)
     ):
         try:
             file_path = Storage.get_file(file.path)
@@ -638,7 +656,7 @@ async def get_html_file_content_by_id(id: str, user=Depends(get_verified_user)):
     if (
         file.user_id == user.id
         or user.role == "admin"
-        or has_access_to_file(id, "read", user)
+        or has_access_to_file(id, "read", user, file=file)
     ):
         try:
             file_path = Storage.get_file(file.path)
@@ -680,7 +698,7 @@ async def get_file_content_by_id(id: str, user=Depends(get_verified_user)):
     if (
         file.user_id == user.id
         or user.role == "admin"
-        or has_access_to_file(id, "read", user)
+        or has_access_to_file(id, "read", user, file=file)
     ):
         file_path = file.path
 
@@ -742,7 +760,7 @@ async def delete_file_by_id(id: str, user=Depends(get_verified_user)):
     if (
         file.user_id == user.id
         or user.role == "admin"
-        or has_access_to_file(id, "write", user)
+        or has_access_to_file(id, "write", user, file=file)
     ):
 
         result = Files.delete_file_by_id(id)
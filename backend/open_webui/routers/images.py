@@ -621,8 +621,13 @@ async def image_generations(
                 else:
                     image_data, content_type = get_image_data(image["b64_json"])
 
-                _, url = upload_image(
-                    request, image_data, content_type, {**data, **metadata}, user
+                _, url = await asyncio.to_thread(
+                    upload_image,
+                    request,
+                    image_data,
+                    content_type,
+                    {**data, **metadata},
+                    user,
                 )
                 images.append({"url": url})
             return images
@@ -673,8 +678,13 @@ async def image_generations(
                     image_data, content_type = get_image_data(
                         image["bytesBase64Encoded"]
                     )
-                    _, url = upload_image(
-                        request, image_data, content_type, {**data, **metadata}, user
+                    _, url = await asyncio.to_thread(
+                        upload_image,
+                        request,
+                        image_data,
+                        content_type,
+                        {**data, **metadata},
+                        user,
                     )
                     images.append({"url": url})
             elif model.endswith(":generateContent"):
@@ -684,7 +694,8 @@ async def image_generations(
                             image_data, content_type = get_image_data(
                                 part["inlineData"]["data"]
                             )
-                            _, url = upload_image(
+                            _, url = await asyncio.to_thread(
+                                upload_image,
                                 request,
                                 image_data,
                                 content_type,
@@ -739,7 +750,8 @@ async def image_generations(
                     }
 
                 image_data, content_type = get_image_data(image["url"], headers)
-                _, url = upload_image(
+                _, url = await asyncio.to_thread(
+                    upload_image,
                     request,
                     image_data,
                     content_type,
@@ -786,7 +798,8 @@ async def image_generations(
 
             for image in res["images"]:
                 image_data, content_type = get_image_data(image)
-                _, url = upload_image(
+                _, url = await asyncio.to_thread(
+                    upload_image,
                     request,
                     image_data,
                     content_type,
@@ -941,8 +954,13 @@ async def image_edits(
                 else:
                     image_data, content_type = get_image_data(image["b64_json"])
 
-                _, url = upload_image(
-                    request, image_data, content_type, {**data, **metadata}, user
+                _, url = await asyncio.to_thread(
+                    upload_image,
+                    request,
+                    image_data,
+                    content_type,
+                    {**data, **metadata},
+                    user,
                 )
                 images.append({"url": url})
             return images
@@ -996,7 +1014,8 @@ async def image_edits(
                         image_data, content_type = get_image_data(
                             part["inlineData"]["data"]
                         )
-                        _, url = upload_image(
+                        _, url = await asyncio.to_thread(
+                            upload_image,
                             request,
                             image_data,
                             content_type,
@@ -1078,7 +1097,8 @@ async def image_edits(
                     }
 
                 image_data, content_type = get_image_data(image_url, headers)
-                _, url = upload_image(
+                _, url = await asyncio.to_thread(
+                    upload_image,
                     request,
                     image_data,
                     content_type,
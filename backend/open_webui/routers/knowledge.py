@@ -2,6 +2,7 @@ from typing import List, Optional
 from pydantic import BaseModel
 from fastapi import APIRouter, Depends, HTTPException, status, Request, Query
 from fastapi.concurrency import run_in_threadpool
+import asyncio
 import logging
 
 from open_webui.models.groups import Groups
@@ -28,6 +29,7 @@ from open_webui.utils.access_control import has_access, has_permission
 
 
 from open_webui.config import BYPASS_ADMIN_ACCESS_CONTROL
+from open_webui.env import KNOWLEDGE_REINDEX_CONCURRENCY
 from open_webui.models.models import Models, ModelForm
 
 
@@ -58,8 +60,11 @@ async def get_knowledge_bases(page: Optional[int] = 1, user=Depends(get_verified
     skip = (page - 1) * limit
 
     filter = {}
+    # Reused for the write_access checks below; None lets has_access load it
+    user_group_ids = None
     if not user.role == "admin" or not BYPASS_ADMIN_ACCESS_CONTROL:
         groups = Groups.get_groups_by_member_id(user.id)
+        user_group_ids = {group.id for group in groups}
         if groups:
             filter["group_ids"] = [group.id for group in groups]
 
@@ -75,7 +80,12 @@ async def get_knowledge_bases(page: Optional[int] = 1, user=Depends(get_verified
                 **knowledge_base.model_dump(),
                 write_access=(
                     user.id == knowledge_base.user_id
-                    or has_access(user.id, "write", knowledge_base.access_control)
+                    or has_access(
+                        user.id,
+                        "write",
+                        knowledge_base.access_control,
+                        user_group_ids,
+                    )
                 ),
             )
             for knowledge_base in result.items
@@ -101,8 +111,11 @@ async def search_knowledge_bases(
     if view_option:
         filter["view_option"] = view_option
 
+    # Reused for the write_access checks below; None lets has_access load it
+    user_group_ids = None
     if not user.role == "admin" or not BYPASS_ADMIN_ACCESS_CONTROL:
         groups = Groups.get_groups_by_member_id(user.id)
+        user_group_ids = {group.id for group in groups}
         if groups:
             filter["group_ids"] = [group.id for group in groups]
 
@@ -118,7 +131,12 @@ async def search_knowledge_bases(
                 **knowledge_base.model_dump(),
                 write_access=(
                     user.id == knowledge_base.user_id
-                    or has_access(user.id, "write", knowledge_base.access_control)
+                    or has_access(
+                        user.id,
+                        "write",
+                        knowledge_base.access_control,
+                        user_group_ids,
+                    )
                 ),
             )
             for knowledge_base in result.items
@@ -219,23 +237,39 @@ async def reindex_knowledge_files(request: Request, user=Depends(get_verified_us
                 log.error(f"Error deleting collection {knowledge_base.id}: {str(e)}")
                 continue  # Skip, don't raise
 
-            failed_files = []
-            for file in files:
-                try:
-                    await run_in_threadpool(
-                        process_file,
-                        request,
-                        ProcessFileForm(
-                            file_id=file.id, collection_name=knowledge_base.id
-                        ),
-                        user=user,
-                    )
-                except Exception as e:
-                    log.error(
-                        f"Error processing file {file.filename} (ID: {file.id}): {str(e)}"
-                    )
-                    failed_files.append({"file_id": file.id, "error": str(e)})
-                    continue
+            # Files are independent, so process a few at a time instead of
+            # waiting on each one's embedding round-trips in turn
+            semaphore = asyncio.Semaphore(KNOWLEDGE_REINDEX_CONCURRENCY)
+
+            async def reindex_file(file):
+                async with semaphore:
+                    try:
+                        await run_in_threadpool(
+                            process_file,
+                            request,
+                            ProcessFileForm(
+                                file_id=file.id, collection_name=knowledge_base.id
+                            ),
+                            user=user,
+                        )
+                    except Exception as e:
+                        log.error(
+                            f"Error processing file {file.filename} (ID: {file.id}): {str(e)}"
+                        )
+                        return {"file_id": file.id, "error": str(e)}
+
+            # Process files one at a time until one succeeds and has re-created
+            # the collection, so the concurrent ones don't race to create it
+            pending = list(files)
+            results = []
+            while pending:
+                result = await reindex_file(pending.pop(0))
+                results.append(result)
+                if not result:
+                    break
+
+            results += await asyncio.gather(*[reindex_file(file) for file in pending])
+            failed_files = [result for result in results if result]
 
         except Exception as e:
             log.error(f"Error processing knowledge base {knowledge_base.id}: {str(e)}")
@@ -769,10 +803,9 @@ async def add_files_to_knowledge_batch(
 
     # Only add files that were successfully processed
     successful_file_ids = [r.file_id for r in result.results if r.status == "completed"]
-    for file_id in successful_file_ids:
-        Knowledges.add_file_to_knowledge_by_id(
-            knowledge_id=id, file_id=file_id, user_id=user.id
-        )
+    Knowledges.add_files_to_knowledge_by_id(
+        knowledge_id=id, file_ids=successful_file_ids, user_id=user.id
+    )
 
     # If there were any errors, include them in the response
     if result.errors:
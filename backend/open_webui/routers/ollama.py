@@ -18,7 +18,9 @@ from aiocache import cached
 import requests
 
 from open_webui.utils.headers import include_user_info_headers
+from open_webui.utils.json import loads as json_loads
 from open_webui.models.chats import Chats
+from open_webui.models.groups import Groups
 from open_webui.models.users import UserModel
 
 from open_webui.env import (
@@ -93,7 +95,7 @@ async def send_get_request(url, key=None, user: UserModel = None):
                 headers=headers,
                 ssl=AIOHTTP_CLIENT_SESSION_SSL,
             ) as response:
-                return await response.json()
+                return await response.json(loads=json_loads)
     except Exception as e:
         # Handle connection error here
         log.error(f"Connection error: {e}")
@@ -398,17 +400,20 @@ async def get_all_models(request: Request, user: UserModel = None):
 
         try:
             loaded_models = await get_ollama_loaded_models(request, user=user)
-            expires_map = {
-                m["model"]: m["expires_at"]
-                for m in loaded_models["models"]
-                if "expires_at" in m
-            }
+            expires_map = {}
+            for m in loaded_models["models"]:
+                if "expires_at" not in m:
+                    continue
+                try:
+                    # Parse ISO8601 datetime with offset, get unix timestamp as int
+                    dt = datetime.fromisoformat(m["expires_at"])
+                except (ValueError, TypeError):
+                    continue
+                expires_map[m["model"]] = int(dt.timestamp())
 
             for m in models["models"]:
                 if m["model"] in expires_map:
-                    # Parse ISO8601 datetime with offset, get unix timestamp as int
-                    dt = datetime.fromisoformat(expires_map[m["model"]])
-                    m["expires_at"] = int(dt.timestamp())
+                    m["expires_at"] = expires_map[m["model"]]
         except Exception as e:
             log.debug(f"Failed to get loaded models: {e}")
 
@@ -424,11 +429,15 @@ async def get_all_models(request: Request, user: UserModel = None):
 async def get_filtered_models(models, user):
     # Filter models based on user access control
     filtered_models = []
+    user_group_ids = set(Groups.get_group_ids_by_member_id(user.id))
     for model in models.get("models", []):
         model_info = Models.get_model_by_id(model["model"])
         if model_info:
             if user.id == model_info.user_id or has_access(
-                user.id, type="read", access_control=model_info.access_control
+                user.id,
+                type="read",
+                access_control=model_info.access_control,
+                user_group_ids=user_group_ids,
             ):
                 filtered_models.append(model)
     return filtered_models
@@ -1581,11 +1590,15 @@ async def get_openai_models(
     if user.role == "user" and not BYPASS_MODEL_ACCESS_CONTROL:
         # Filter models based on user access control
         filtered_models = []
+        user_group_ids = set(Groups.get_group_ids_by_member_id(user.id))
         for model in models:
             model_info = Models.get_model_by_id(model["id"])
             if model_info:
                 if user.id == model_info.user_id or has_access(
-                    user.id, type="read", access_control=model_info.access_control
+                    user.id,
+                    type="read",
+                    access_control=model_info.access_control,
+                    user_group_ids=user_group_ids,
                 ):
                     filtered_models.append(model)
         models = filtered_models
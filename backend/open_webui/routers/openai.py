@@ -20,6 +20,7 @@ from fastapi.responses import (
 from pydantic import BaseModel
 from starlette.background import BackgroundTask
 
+from open_webui.models.groups import Groups
 from open_webui.models.models import Models
 from open_webui.config import (
     CACHE_DIR,
@@ -49,6 +50,7 @@ from open_webui.utils.misc import (
 from open_webui.utils.auth import get_admin_user, get_verified_user
 from open_webui.utils.access_control import has_access
 from open_webui.utils.headers import include_user_info_headers
+from open_webui.utils.json import loads as json_loads
 
 
 log = logging.getLogger(__name__)
@@ -61,23 +63,33 @@ log = logging.getLogger(__name__)
 ##########################################
 
 
-async def send_get_request(url, key=None, user: UserModel = None):
+async def send_get_request(
+    url,
+    key=None,
+    user: UserModel = None,
+    session: Optional[aiohttp.ClientSession] = None,
+):
     timeout = aiohttp.ClientTimeout(total=AIOHTTP_CLIENT_TIMEOUT_MODEL_LIST)
     try:
-        async with aiohttp.ClientSession(timeout=timeout, trust_env=True) as session:
-            headers = {
-                **({"Authorization": f"Bearer {key}"} if key else {}),
-            }
+        if session is None:
+            async with aiohttp.ClientSession(trust_env=True) as session:
+                return await send_get_request(url, key, user=user, session=session)
 
-            if ENABLE_FORWARD_USER_INFO_HEADERS and user:
-                headers = include_user_info_headers(headers, user)
+        headers = {
+            **({"Authorization": f"Bearer {key}"} if key else {}),
+        }
 
-            async with session.get(
-                url,
-                headers=headers,
-                ssl=AIOHTTP_CLIENT_SESSION_SSL,
-            ) as response:
-                return await response.json()
+        if ENABLE_FORWARD_USER_INFO_HEADERS and user:
+            headers = include_user_info_headers(headers, user)
+
+        async with session.get(
+            url,
+            headers=headers,
+            ssl=AIOHTTP_CLIENT_SESSION_SSL,
+            timeout=timeout,
+        ) as response:
+            # Model lists can run to megabytes of JSON, parse them with orjson
+            return await response.json(loads=json_loads)
     except Exception as e:
         # Handle connection error here
         log.error(f"Connection error: {e}")
@@ -94,6 +106,22 @@ async def cleanup_response(
         await session.close()
 
 
+def get_openai_session(request: Request) -> aiohttp.ClientSession:
+    # One session for the app's lifetime, so model listing, embeddings and
+    # chat completions reuse pooled keep-alive connections instead of opening
+    # and handshaking new ones for every call.
+    # Responses must not leak cookies between users, hence the dummy jar.
+    session = getattr(request.app.state, "openai_session", None)
+    if session is None or session.closed:
+        session = aiohttp.ClientSession(
+            trust_env=True,
+            timeout=aiohttp.ClientTimeout(total=AIOHTTP_CLIENT_TIMEOUT),
+            cookie_jar=aiohttp.DummyCookieJar(),
+        )
+        request.app.state.openai_session = session
+    return session
+
+
 def openai_reasoning_model_handler(payload):
     """
     Handle reasoning model specific parameters
@@ -357,6 +385,7 @@ async def get_all_models_responses(request: Request, user: UserModel) -> list:
         else:
             request.app.state.config.OPENAI_API_KEYS += [""] * (num_urls - num_keys)
 
+    session = get_openai_session(request)
     request_tasks = []
     for idx, url in enumerate(request.app.state.config.OPENAI_API_BASE_URLS):
         if (str(idx) not in request.app.state.config.OPENAI_API_CONFIGS) and (
@@ -367,6 +396,7 @@ async def get_all_models_responses(request: Request, user: UserModel) -> list:
                     f"{url}/models",
                     request.app.state.config.OPENAI_API_KEYS[idx],
                     user=user,
+                    session=session,
                 )
             )
         else:
@@ -387,6 +417,7 @@ async def get_all_models_responses(request: Request, user: UserModel) -> list:
                             f"{url}/models",
                             request.app.state.config.OPENAI_API_KEYS[idx],
                             user=user,
+                            session=session,
                         )
                     )
                 else:
@@ -456,11 +487,15 @@ async def get_all_models_responses(request: Request, user: UserModel) -> list:
 async def get_filtered_models(models, user):
     # Filter models based on user access control
     filtered_models = []
+    user_group_ids = set(Groups.get_group_ids_by_member_id(user.id))
     for model in models.get("data", []):
         model_info = Models.get_model_by_id(model["id"])
         if model_info:
             if user.id == model_info.user_id or has_access(
-                user.id, type="read", access_control=model_info.access_control
+                user.id,
+                type="read",
+                access_control=model_info.access_control,
+                user_group_ids=user_group_ids,
             ):
                 filtered_models.append(model)
     return filtered_models
@@ -921,14 +956,11 @@ async def generate_chat_completion(
     payload = json.dumps(payload)
 
     r = None
-    session = None
     streaming = False
     response = None
 
     try:
-        session = aiohttp.ClientSession(
-            trust_env=True, timeout=aiohttp.ClientTimeout(total=AIOHTTP_CLIENT_TIMEOUT)
-        )
+        session = get_openai_session(request)
 
         r = await session.request(
             method="POST",
@@ -946,9 +978,7 @@ async def generate_chat_completion(
                 stream_chunks_handler(r.content),
                 status_code=r.status,
                 headers=dict(r.headers),
-                background=BackgroundTask(
-                    cleanup_response, response=r, session=session
-                ),
+                background=BackgroundTask(cleanup_response, response=r, session=None),
             )
         else:
             try:
@@ -973,7 +1003,7 @@ async def generate_chat_completion(
         )
     finally:
         if not streaming:
-            await cleanup_response(r, session)
+            await cleanup_response(r, None)
 
 
 async def embeddings(request: Request, form_data: dict, user):
@@ -1006,14 +1036,13 @@ async def embeddings(request: Request, form_data: dict, user):
     )
 
     r = None
-    session = None
     streaming = False
 
     headers, cookies = await get_headers_and_cookies(
         request, url, key, api_config, user=user
     )
     try:
-        session = aiohttp.ClientSession(trust_env=True)
+        session = get_openai_session(request)
         r = await session.request(
             method="POST",
             url=f"{url}/embeddings",
@@ -1028,9 +1057,7 @@ async def embeddings(request: Request, form_data: dict, user):
                 r.content,
                 status_code=r.status,
                 headers=dict(r.headers),
-                background=BackgroundTask(
-                    cleanup_response, response=r, session=session
-                ),
+                background=BackgroundTask(cleanup_response, response=r, session=None),
             )
         else:
             try:
@@ -1055,7 +1082,7 @@ async def embeddings(request: Request, form_data: dict, user):
         )
     finally:
         if not streaming:
-            await cleanup_response(r, session)
+            await cleanup_response(r, None)
 
 
 @router.api_route("/{path:path}", methods=["GET", "POST", "PUT", "DELETE"])
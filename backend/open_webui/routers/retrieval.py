@@ -2557,8 +2557,13 @@ async def process_files_batch(
             )
 
             # Update all files with collection name
-            for file_update, file_result in zip(file_updates, file_results):
-                Files.update_file_by_id(id=file_result.file_id, form_data=file_update)
+            Files.update_files_by_ids(
+                {
+                    file_result.file_id: file_update
+                    for file_update, file_result in zip(file_updates, file_results)
+                }
+            )
+            for file_result in file_results:
                 file_result.status = "completed"
 
         except Exception as e:
@@ -140,7 +140,7 @@ async def get_tools(request: Request, user=Depends(get_verified_user)):
         # Admin can see all tools
         return tools
     else:
-        user_group_ids = {group.id for group in Groups.get_groups_by_member_id(user.id)}
+        user_group_ids = set(Groups.get_group_ids_by_member_id(user.id))
         tools = [
             tool
             for tool in tools
@@ -84,9 +84,7 @@ async def get_users(
             UserGroupIdsModel(
                 **{
                     **user.model_dump(),
-                    "group_ids": [
-                        group.id for group in Groups.get_groups_by_member_id(user.id)
-                    ],
+                    "group_ids": Groups.get_group_ids_by_member_id(user.id),
                 }
             )
             for user in users
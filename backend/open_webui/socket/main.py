@@ -1,11 +1,12 @@
 import asyncio
+import json
 import random
 
 import socketio
 import logging
 import sys
 import time
-from typing import Dict, Set
+from typing import Dict, Optional, Set
 from redis import asyncio as aioredis
 import pycrdt as Y
 
@@ -39,6 +40,7 @@ from open_webui.env import (
     WEBSOCKET_SERVER_ENGINEIO_LOGGING,
 )
 from open_webui.utils.auth import decode_token
+from open_webui.utils import json as json_utils
 from open_webui.socket.utils import RedisDict, RedisLock, YdocManager
 from open_webui.tasks import create_task, stop_item_tasks
 from open_webui.utils.redis import get_redis_connection
@@ -59,6 +61,21 @@ REDIS = None
 # Configure CORS for Socket.IO
 SOCKETIO_CORS_ORIGINS = "*" if CORS_ALLOW_ORIGIN == ["*"] else CORS_ALLOW_ORIGIN
 
+
+# Chat and channel events carry full message payloads; encode them with orjson
+class ORJSONSerializer:
+    """json-compatible dumps/loads for Socket.IO packets backed by orjson."""
+
+    @staticmethod
+    def dumps(obj, *args, **kwargs) -> str:
+        # orjson output is always compact, so separators etc. are ignored
+        return json_utils.dumps(obj)
+
+    @staticmethod
+    def loads(s, *args, **kwargs):
+        return json_utils.loads(s)
+
+
 if WEBSOCKET_MANAGER == "redis":
     if WEBSOCKET_SENTINEL_HOSTS:
         mgr = socketio.AsyncRedisManager(
@@ -82,6 +99,7 @@ if WEBSOCKET_MANAGER == "redis":
         ping_interval=WEBSOCKET_SERVER_PING_INTERVAL,
         ping_timeout=WEBSOCKET_SERVER_PING_TIMEOUT,
         engineio_logger=WEBSOCKET_SERVER_ENGINEIO_LOGGING,
+        json=ORJSONSerializer,
     )
 else:
     sio = socketio.AsyncServer(
@@ -94,6 +112,7 @@ else:
         ping_interval=WEBSOCKET_SERVER_PING_INTERVAL,
         ping_timeout=WEBSOCKET_SERVER_PING_TIMEOUT,
         engineio_logger=WEBSOCKET_SERVER_ENGINEIO_LOGGING,
+        json=ORJSONSerializer,
     )
 
 
@@ -267,6 +286,38 @@ async def emit_to_users(event: str, data: dict, user_ids: list[str]):
         log.debug(f"Failed to emit event {event} to users {user_ids}: {e}")
 
 
+_emit_queue: Optional[asyncio.Queue] = None
+_emit_worker: Optional[asyncio.Task] = None
+
+
+async def _drain_emit_queue(queue: asyncio.Queue):
+    while True:
+        event, data, room = await queue.get()
+        try:
+            await sio.emit(event, data, to=room)
+        except Exception as e:
+            log.warning(f"Failed to emit event {event} to room {room}: {e}")
+        finally:
+            queue.task_done()
+
+
+def emit_nowait(event: str, data: dict, room: str):
+    """
+    Queue an event for a room without waiting for it to be delivered.
+
+    Events are sent in order by a single background worker and are never
+    dropped. Only use it for events a client can afford to see late, such as
+    reactions; message create/update/delete should await sio.emit.
+    """
+    global _emit_queue, _emit_worker
+
+    if _emit_worker is None or _emit_worker.done():
+        _emit_queue = asyncio.Queue()
+        _emit_worker = asyncio.create_task(_drain_emit_queue(_emit_queue))
+
+    _emit_queue.put_nowait((event, data, room))
+
+
 async def enter_room_for_users(room: str, user_ids: list[str]):
     """
     Make all sessions of a user join a specific room.
@@ -690,6 +741,122 @@ async def disconnect(sid):
         # print(f"Unknown session ID {sid} disconnected")
 
 
+def _update_message_from_event(chat_id, message_id, event_data):
+    """Persist an emitted event into the stored chat message."""
+    if "type" in event_data and event_data["type"] == "status":
+        Chats.add_message_status_to_chat_by_id_and_message_id(
+            chat_id,
+            message_id,
+            event_data.get("data", {}),
+        )
+
+    if "type" in event_data and event_data["type"] == "message":
+        message = Chats.get_message_by_id_and_message_id(
+            chat_id,
+            message_id,
+        )
+
+        if message:
+            content = message.get("content", "")
+            content += event_data.get("data", {}).get("content", "")
+
+            Chats.upsert_message_to_chat_by_id_and_message_id(
+                chat_id,
+                message_id,
+                {
+                    "content": content,
+                },
+            )
+
+    if "type" in event_data and event_data["type"] == "replace":
+        content = event_data.get("data", {}).get("content", "")
+
+        Chats.upsert_message_to_chat_by_id_and_message_id(
+            chat_id,
+            message_id,
+            {
+                "content": content,
+            },
+        )
+
+    if "type" in event_data and event_data["type"] == "embeds":
+        message = Chats.get_message_by_id_and_message_id(
+            chat_id,
+            message_id,
+        )
+
+        embeds = event_data.get("data", {}).get("embeds", [])
+        embeds.extend(message.get("embeds", []))
+
+        Chats.upsert_message_to_chat_by_id_and_message_id(
+            chat_id,
+            message_id,
+            {
+                "embeds": embeds,
+            },
+        )
+
+    if "type" in event_data and event_data["type"] == "files":
+        message = Chats.get_message_by_id_and_message_id(
+            chat_id,
+            message_id,
+        )
+
+        files = event_data.get("data", {}).get("files", [])
+        files.extend(message.get("files", []))
+
+        Chats.upsert_message_to_chat_by_id_and_message_id(
+            chat_id,
+            message_id,
+            {
+                "files": files,
+            },
+        )
+
+    if event_data.get("type") in ["source", "citation"]:
+        data = event_data.get("data", {})
+        if data.get("type") == None:
+            message = Chats.get_message_by_id_and_message_id(
+                chat_id,
+                message_id,
+            )
+
+            sources = message.get("sources", [])
+            sources.append(data)
+
+            Chats.upsert_message_to_chat_by_id_and_message_id(
+                chat_id,
+                message_id,
+                {
+                    "sources": sources,
+                },
+            )
+
+
+# Per-message locks for the chat JSON writes below, with a count of the
+# emitters using each one so the entry can be dropped when the last one is done
+MESSAGE_EVENT_LOCKS: Dict[tuple, list] = {}
+
+
+async def _persist_message_event(chat_id, message_id, event_data):
+    # Every event is a read-modify-write of the whole chat, run in a worker
+    # thread so it does not block the event loop. Writes for the same message
+    # must not overlap or an earlier one (e.g. a content delta) is lost, so
+    # they are applied one at a time in the order they were emitted
+    key = (chat_id, message_id)
+    entry = MESSAGE_EVENT_LOCKS.setdefault(key, [asyncio.Lock(), 0])
+    entry[1] += 1
+    try:
+        async with entry[0]:
+            await asyncio.to_thread(
+                _update_message_from_event, chat_id, message_id, event_data
+            )
+    finally:
+        entry[1] -= 1
+        if entry[1] == 0:
+            del MESSAGE_EVENT_LOCKS[key]
+
+
 def get_event_emitter(request_info, update_db=True):
     async def __event_emitter__(event_data):
         user_id = request_info["user_id"]
@@ -710,95 +877,11 @@ def get_event_emitter(request_info, update_db=True):
             and message_id
             and not request_info.get("chat_id", "").startswith("local:")
         ):
-
-            if "type" in event_data and event_data["type"] == "status":
-                Chats.add_message_status_to_chat_by_id_and_message_id(
-                    request_info["chat_id"],
-                    request_info["message_id"],
-                    event_data.get("data", {}),
-                )
-
-            if "type" in event_data and event_data["type"] == "message":
-                message = Chats.get_message_by_id_and_message_id(
-                    request_info["chat_id"],
-                    request_info["message_id"],
-                )
-
-                if message:
-                    content = message.get("content", "")
-                    content += event_data.get("data", {}).get("content", "")
-
-                    Chats.upsert_message_to_chat_by_id_and_message_id(
-                        request_info["chat_id"],
-                        request_info["message_id"],
-                        {
-                            "content": content,
-                        },
-                    )
-
-            if "type" in event_data and event_data["type"] == "replace":
-                content = event_data.get("data", {}).get("content", "")
-
-                Chats.upsert_message_to_chat_by_id_and_message_id(
-                    request_info["chat_id"],
-                    request_info["message_id"],
-                    {
-                        "content": content,
-                    },
-                )
-
-            if "type" in event_data and event_data["type"] == "embeds":
-                message = Chats.get_message_by_id_and_message_id(
-                    request_info["chat_id"],
-                    request_info["message_id"],
-                )
-
-                embeds = event_data.get("data", {}).get("embeds", [])
-                embeds.extend(message.get("embeds", []))
-
-                Chats.upsert_message_to_chat_by_id_and_message_id(
-                    request_info["chat_id"],
-                    request_info["message_id"],
-                    {
-                        "embeds": embeds,
-                    },
-                )
-
-            if "type" in event_data and event_data["type"] == "files":
-                message = Chats.get_message_by_id_and_message_id(
-                    request_info["chat_id"],
-                    request_info["message_id"],
-                )
-
-                files = event_data.get("data", {}).get("files", [])
-                files.extend(message.get("files", []))
-
-                Chats.upsert_message_to_chat_by_id_and_message_id(
-                    request_info["chat_id"],
-                    request_info["message_id"],
-                    {
-                        "files": files,
-                    },
-                )
-
-            if event_data.get("type") in ["source", "citation"]:
-                data = event_data.get("data", {})
-                if data.get("type") == None:
-                    message = Chats.get_message_by_id_and_message_id(
-                        request_info["chat_id"],
-                        request_info["message_id"],
-                    )
-
-                    sources = message.get("sources", [])
-                    sources.append(data)
-
-                    Chats.upsert_message_to_chat_by_id_and_message_id(
-                        request_info["chat_id"],
-                        request_info["message_id"],
-                        {
-                            "sources": sources,
-                        },
-                    )
+            await _persist_message_event(
+                request_info["chat_id"],
+                request_info["message_id"],
+                event_data,
+            )
 
     if (
         "user_id" in request_info
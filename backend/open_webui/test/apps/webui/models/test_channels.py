@@ -0,0 +1,41 @@
+import pytest
+
+from open_webui.models import channels as channels_module
+from open_webui.models.channels import (
+    Channel,
+    ChannelMember,
+    Channels,
+    CreateChannelForm,
+)
+from test.util.sqlite_db import mock_sqlite_db
+
+
+@pytest.fixture
+def channel(monkeypatch):
+    with mock_sqlite_db(
+        monkeypatch, channels_module, Channel.__table__, ChannelMember.__table__
+    ):
+        channel = Channels.insert_new_channel(
+            CreateChannelForm(name="General"), "owner"
+        )
+        Channels.join_channel(channel.id, "member")
+        yield channel
+
+
+def test_get_channel_with_membership_by_id(channel):
+    found, is_member = Channels.get_channel_with_membership_by_id(channel.id, "member")
+    assert found.id == channel.id
+    assert is_member
+
+    found, is_member = Channels.get_channel_with_membership_by_id(
+        channel.id, "outsider"
+    )
+    assert found.id == channel.id
+    assert not is_member
+
+
+def test_get_channel_with_membership_by_id_unknown_channel(channel):
+    assert Channels.get_channel_with_membership_by_id("missing", "member") == (
+        None,
+        False,
+    )
@@ -0,0 +1,61 @@
+import pytest
+
+from open_webui.models import chats as chats_module
+from open_webui.models.chats import Chat, ChatForm, Chats
+from test.util.sqlite_db import mock_sqlite_db
+
+
+MESSAGE_IDS = ["0b7e3f52-9c1a", "m.1", 'm"1', "m\\1", 'm"].x.["y']
+
+
+@pytest.fixture
+def chat(monkeypatch):
+    with mock_sqlite_db(monkeypatch, chats_module, Chat.__table__):
+        yield Chats.insert_new_chat(
+            "user-1",
+            ChatForm(
+                chat={
+                    "title": "Chat",
+                    "history": {
+                        "currentId": MESSAGE_IDS[0],
+                        "messages": {
+                            message_id: {"id": message_id, "content": ""}
+                            for message_id in MESSAGE_IDS
+                        },
+                    },
+                }
+            ),
+        )
+
+
+def status_history(chat_id, message_id):
+    messages = Chats.get_chat_by_id(chat_id).chat["history"]["messages"]
+    return messages[message_id].get("statusHistory")
+
+
+@pytest.mark.parametrize("message_id", MESSAGE_IDS)
+def test_add_message_status_appends(chat, message_id):
+    assert Chats.add_message_status_to_chat_by_id_and_message_id(
+        chat.id, message_id, {"action": "web_search", "done": False}
+    )
+    assert Chats.add_message_status_to_chat_by_id_and_message_id(
+        chat.id, message_id, {"action": "web_search", "done": True}
+    )
+
+    assert status_history(chat.id, message_id) == [
+        {"action": "web_search", "done": False},
+        {"action": "web_search", "done": True},
+    ]
+
+    # No other message, or any other part of the chat, is touched
+    for other_id in MESSAGE_IDS:
+        if other_id != message_id:
+            assert status_history(chat.id, other_id) is None
+    assert Chats.get_chat_by_id(chat.id).chat["title"] == "Chat"
+
+
+def test_add_message_status_unknown_message(chat):
+    assert not Chats.add_message_status_to_chat_by_id_and_message_id(
+        chat.id, "missing", {"action": "web_search"}
+    )
+    assert "missing" not in Chats.get_chat_by_id(chat.id).chat["history"]["messages"]
@@ -0,0 +1,240 @@
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import null
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Query, Session
+
+from open_webui.models import files as files_module
+from open_webui.models.files import File, FileForm, FileUpdateForm, Files
+from test.util.sqlite_db import mock_sqlite_db
+
+
+@pytest.fixture
+def files_db(monkeypatch):
+    with mock_sqlite_db(monkeypatch, files_module, File.__table__):
+        for id, filename in [
+            ("1", "Ärger.txt"),
+            ("2", "report.TXT"),
+            ("3", "a_b.md"),
+            ("4", "ab.md"),
+        ]:
+            Files.insert_new_file(
+                "user-1", FileForm(id=id, filename=filename, path=f"/{filename}")
+            )
+        Files.insert_new_file(
+            "user-2", FileForm(id="5", filename="other.txt", path="/other.txt")
+        )
+        yield
+
+
+def search(pattern, user_id=None):
+    return sorted(
+        file.filename
+        for file in Files.search_files_by_filename(pattern, user_id=user_id)
+    )
+
+
+def test_search_files_by_filename_is_case_insensitive(files_db):
+    assert search("*.txt", "user-1") == ["report.TXT", "Ärger.txt"]
+    assert search("REPORT*") == ["report.TXT"]
+
+
+def test_search_files_by_filename_non_ascii_on_sqlite(files_db):
+    # SQLite's lower() leaves Ä alone, the match must not depend on it
+    assert search("ärger*") == ["Ärger.txt"]
+    assert search("Ä?ger.txt") == ["Ärger.txt"]
+
+
+def test_search_files_by_filename_escapes_like_wildcards(files_db):
+    assert search("a_*") == ["a_b.md"]
+    assert search("a%*") == []
+
+
+def test_search_files_by_filename_character_classes(files_db):
+    assert search("[ar]*.md") == ["a_b.md", "ab.md"]
+
+
+@pytest.fixture
+def data_db(monkeypatch):
+    with mock_sqlite_db(monkeypatch, files_module, File.__table__) as engine:
+        with engine.begin() as conn:
+            conn.execute(
+                File.__table__.insert(),
+                [
+                    {
+                        "id": id,
+                        "user_id": "user-1",
+                        "filename": f"{id}.txt",
+                        "data": data,
+                        "created_at": 0,
+                        "updated_at": 0,
+                    }
+                    for id, data in [
+                        ("object", {"content": "text", "status": "completed"}),
+                        ("no-content", {"status": "pending"}),
+                        # Python None in a JSON column is stored as JSON null
+                        ("json-null", None),
+                        ("sql-null", null()),
+                        ("scalar", 5),
+                        ("array", ["content"]),
+                    ]
+                ],
+            )
+        yield engine
+
+
+def test_query_files_without_content_on_sqlite(data_db):
+    with Session(data_db) as db:
+        rows = Files._query_files(db, include_content=False).all()
+
+    assert {row.id: row.data for row in rows} == {
+        "object": {"status": "completed"},
+        "no-content": {"status": "pending"},
+        "json-null": None,
+        "sql-null": None,
+        "scalar": 5,
+        "array": ["content"],
+    }
+
+
+def test_get_files_without_content(data_db):
+    with data_db.begin() as conn:
+        conn.execute(File.__table__.delete().where(File.id.in_(["scalar", "array"])))
+
+    files = {file.id: file for file in Files.get_files(include_content=False)}
+    assert files["object"].data == {"status": "completed"}
+    assert files["json-null"].data is None
+    assert files["sql-null"].data is None
+
+    # The content is only left out of list views
+    assert Files.get_file_by_id("object").data["content"] == "text"
+
+
+def test_query_files_without_content_on_postgresql():
+    # Only objects support "-", JSON null and scalars are passed through as is
+    db = SimpleNamespace(
+        bind=SimpleNamespace(dialect=postgresql.dialect()),
+        query=lambda *entities: Query(entities),
+    )
+    sql = str(
+        Files._query_files(db, include_content=False).statement.compile(
+            dialect=postgresql.dialect()
+        )
+    )
+
+    assert (
+        "CASE WHEN (jsonb_typeof(CAST(file.data AS JSONB)) = %(jsonb_typeof_1)s) "
+        "THEN CAST(file.data AS JSONB) - %(param_1)s "
+        "ELSE CAST(file.data AS JSONB) END AS data"
+    ) in sql
+    assert "file.data," not in sql
+
+
+@pytest.fixture
+def paged_db(monkeypatch):
+    with mock_sqlite_db(monkeypatch, files_module, File.__table__) as engine:
+        with engine.begin() as conn:
+            conn.execute(
+                File.__table__.insert(),
+                [
+                    {
+                        "id": f"file-{i}",
+                        "user_id": "user-2" if i == 3 else "user-1",
+                        "filename": f"file-{i}.txt",
+                        "created_at": updated_at,
+                        "updated_at": updated_at,
+                    }
+                    # Three files share a timestamp across a page boundary
+                    for i, updated_at in enumerate([1, 2, 2, 2, 3], start=1)
+                ],
+            )
+        yield engine
+
+
+def cursor(page):
+    return {"cursor_updated_at": page[-1].updated_at, "cursor_id": page[-1].id}
+
+
+def test_get_files_cursor(paged_db):
+    page = Files.get_files(limit=2)
+    assert [file.id for file in page] == ["file-5", "file-4"]
+
+    page = Files.get_files(limit=2, **cursor(page))
+    assert [file.id for file in page] == ["file-3", "file-2"]
+
+    page = Files.get_files(limit=2, **cursor(page))
+    assert [file.id for file in page] == ["file-1"]
+
+    assert Files.get_files(limit=2, **cursor(page)) == []
+
+
+def test_get_files_by_user_id_cursor(paged_db):
+    page = Files.get_files_by_user_id("user-1", include_content=False, limit=2)
+    assert [file.id for file in page] == ["file-5", "file-4"]
+
+    page = Files.get_files_by_user_id(
+        "user-1", include_content=False, limit=2, **cursor(page)
+    )
+    assert [file.id for file in page] == ["file-2", "file-1"]
+
+
+def test_update_files_by_ids(data_db, monkeypatch):
+    monkeypatch.setattr(files_module.time, "time", lambda: 100)
+
+    assert Files.update_files_by_ids(
+        {
+            "object": FileUpdateForm(hash="abc", data={"status": "failed"}),
+            "json-null": FileUpdateForm(data={"status": "pending"}, meta={"a": 1}),
+            "missing": FileUpdateForm(hash="def"),
+        }
+    )
+
+    file = Files.get_file_by_id("object")
+    assert file.hash == "abc"
+    # data is merged into the existing value, not replaced
+    assert file.data == {"content": "text", "status": "failed"}
+    assert file.updated_at == 100
+
+    file = Files.get_file_by_id("json-null")
+    assert file.data == {"status": "pending"}
+    assert file.meta == {"a": 1}
+    assert file.updated_at == 100
+
+    # Files left out of the update are untouched
+    file = Files.get_file_by_id("no-content")
+    assert file.data == {"status": "pending"}
+    assert file.updated_at == 0
+    assert Files.get_file_by_id("missing") is None
+
+
+def test_update_files_by_ids_matches_update_file_by_id(files_db):
+    form_data = FileUpdateForm(data={"status": "completed"}, meta={"name": "a"})
+
+    Files.update_file_by_id("1", form_data)
+    Files.update_files_by_ids({"2": form_data})
+
+    one, two = Files.get_file_by_id("1"), Files.get_file_by_id("2")
+    assert one.data == two.data == {"status": "completed"}
+    assert one.meta == two.meta == {"name": "a"}
+
+
+def test_get_file_status_by_id(data_db):
+    with data_db.begin() as conn:
+        conn.execute(
+            File.__table__.update()
+            .where(File.id == "no-content")
+            .values(data={"status": "failed", "error": "Unsupported file"})
+        )
+
+    assert Files.get_file_status_by_id("object") == {
+        "status": "completed",
+        "error": None,
+    }
+    assert Files.get_file_status_by_id("no-content") == {
+        "status": "failed",
+        "error": "Unsupported file",
+    }
+    for id in ["json-null", "sql-null", "scalar", "array"]:
+        assert Files.get_file_status_by_id(id) == {"status": None, "error": None}
+    assert Files.get_file_status_by_id("missing") is None
@@ -0,0 +1,57 @@
+import pytest
+
+from open_webui.models import folders as folders_module
+from open_webui.models.folders import Folder, FolderForm, Folders
+from test.util.sqlite_db import mock_sqlite_db
+
+
+@pytest.fixture
+def tree(monkeypatch):
+    # root
+    # ├── a
+    # │   └── a1
+    # │       └── a1x
+    # └── b
+    with mock_sqlite_db(monkeypatch, folders_module, Folder.__table__):
+
+        def add(name, parent=None, user_id="user-1"):
+            return Folders.insert_new_folder(
+                user_id, FolderForm(name=name), parent.id if parent else None
+            )
+
+        root = add("root")
+        a = add("a", root)
+        a1 = add("a1", a)
+        add("a1x", a1)
+        add("b", root)
+        # Same parent id under another user must never be returned
+        add("other", root, user_id="user-2")
+        yield {
+            folder.name: folder for folder in Folders.get_folders_by_user_id("user-1")
+        }
+
+
+def names(folders):
+    return sorted(folder.name for folder in folders)
+
+
+def test_get_children_folders_returns_whole_subtree(tree):
+    assert names(
+        Folders.get_children_folders_by_id_and_user_id(tree["root"].id, "user-1")
+    ) == ["a", "a1", "a1x", "b"]
+    assert names(
+        Folders.get_children_folders_by_id_and_user_id(tree["a"].id, "user-1")
+    ) == ["a1", "a1x"]
+    assert Folders.get_children_folders_by_id_and_user_id(tree["b"].id, "user-1") == []
+    assert (
+        Folders.get_children_folders_by_id_and_user_id(tree["root"].id, "user-2")
+        is None
+    )
+
+
+def test_delete_folder_removes_subtree(tree):
+    deleted = Folders.delete_folder_by_id_and_user_id(tree["a"].id, "user-1")
+
+    assert sorted(deleted) == sorted([tree["a"].id, tree["a1"].id, tree["a1x"].id])
+    assert names(Folders.get_folders_by_user_id("user-1")) == ["b", "root"]
+    assert names(Folders.get_folders_by_user_id("user-2")) == ["other"]
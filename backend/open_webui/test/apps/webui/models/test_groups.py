@@ -0,0 +1,52 @@
+import time
+import uuid
+
+import pytest
+
+from open_webui.models import groups as groups_module
+from open_webui.models.groups import Group, GroupForm, GroupMember, Groups
+from test.util.sqlite_db import mock_sqlite_db
+
+
+@pytest.fixture
+def group(monkeypatch):
+    with mock_sqlite_db(
+        monkeypatch, groups_module, Group.__table__, GroupMember.__table__
+    ) as engine:
+        yield Groups.insert_new_group(
+            "owner", GroupForm(name="Team", description="")
+        ), engine
+
+
+def member_ids(group_id):
+    return sorted(Groups.get_group_user_ids_by_id(group_id) or [])
+
+
+def test_add_users_to_group_skips_duplicates(group):
+    group, _ = group
+
+    assert Groups.add_users_to_group(group.id, ["a", "b", "a"])
+    assert member_ids(group.id) == ["a", "b"]
+
+    assert Groups.add_users_to_group(group.id, ["b", "c"])
+    assert member_ids(group.id) == ["a", "b", "c"]
+
+
+def test_add_users_to_group_ignores_member_added_concurrently(group):
+    group, engine = group
+
+    # Inserted behind the model's back, as another request would
+    now = int(time.time())
+    with engine.begin() as conn:
+        conn.execute(
+            GroupMember.__table__.insert().values(
+                id=str(uuid.uuid4()),
+                group_id=group.id,
+                user_id="d",
+                created_at=now,
+                updated_at=now,
+            )
+        )
+
+    assert Groups.add_users_to_group(group.id, ["d", "e"])
+    assert member_ids(group.id) == ["d", "e"]
@@ -0,0 +1,105 @@
+import pytest
+
+from open_webui.models import messages as messages_module
+from open_webui.models.messages import Message, MessageReaction, Messages
+from test.util.sqlite_db import mock_sqlite_db
+
+
+@pytest.fixture
+def messages_db(monkeypatch):
+    with mock_sqlite_db(
+        monkeypatch, messages_module, Message.__table__, MessageReaction.__table__
+    ) as engine:
+        yield engine
+
+
+def insert_messages(engine, channel_id, created_ats, parent_id=None):
+    with engine.begin() as conn:
+        conn.execute(
+            Message.__table__.insert(),
+            [
+                {
+                    "id": f"{parent_id or channel_id}-{i}",
+                    "user_id": "user-1",
+                    "channel_id": channel_id,
+                    "parent_id": parent_id,
+                    "is_pinned": False,
+                    "content": f"message {i}",
+                    "created_at": created_at,
+                    "updated_at": created_at,
+                }
+                for i, created_at in enumerate(created_ats, start=1)
+            ],
+        )
+
+
+def cursor(page):
+    return {"cursor_created_at": page[-1].created_at, "cursor_id": page[-1].id}
+
+
+def test_add_reaction_to_message_skips_duplicates(messages_db):
+    reaction = Messages.add_reaction_to_message("message-1", "user-1", "👍")
+    assert reaction is not None
+
+    assert Messages.add_reaction_to_message("message-1", "user-1", "👍") is None
+    assert Messages.add_reaction_to_message("message-1", "user-1", "🎉") is not None
+    assert Messages.add_reaction_to_message("message-1", "user-2", "👍") is not None
+
+    with messages_db.connect() as conn:
+        rows = conn.execute(MessageReaction.__table__.select()).fetchall()
+    assert len(rows) == 3
+
+
+def test_get_messages_by_channel_id_cursor(messages_db):
+    # Three messages share a timestamp across a page boundary
+    insert_messages(messages_db, "channel-1", [1, 2, 2, 2, 3])
+    insert_messages(messages_db, "channel-2", [1, 2])
+
+    page = Messages.get_messages_by_channel_id("channel-1", limit=2)
+    assert [message.id for message in page] == ["channel-1-5", "channel-1-4"]
+
+    page = Messages.get_messages_by_channel_id("channel-1", limit=2, **cursor(page))
+    assert [message.id for message in page] == ["channel-1-3", "channel-1-2"]
+
+    page = Messages.get_messages_by_channel_id("channel-1", limit=2, **cursor(page))
+    assert [message.id for message in page] == ["channel-1-1"]
+
+
+def test_get_messages_by_parent_id_cursor(messages_db):
+    insert_messages(messages_db, "channel-1", [1])
+    insert_messages(messages_db, "channel-1", [2, 2, 2], parent_id="channel-1-1")
+
+    page = Messages.get_messages_by_parent_id("channel-1", "channel-1-1", limit=2)
+    assert [message.id for message in page] == ["channel-1-1-3", "channel-1-1-2"]
+
+    # The parent message closes the thread once the replies run out
+    page = Messages.get_messages_by_parent_id(
+        "channel-1", "channel-1-1", limit=2, **cursor(page)
+    )
+    assert [message.id for message in page] == ["channel-1-1-1", "channel-1-1"]
+
+
+@pytest.mark.parametrize("batch_size", [2, 5, 1000])
+def test_delete_messages_by_channel_id_in_batches(messages_db, batch_size):
+    # 5 messages: a partial last batch, an exact batch and a single batch
+    insert_messages(messages_db, "channel-1", [1, 2, 3, 4, 5])
+    insert_messages(messages_db, "channel-2", [1, 2])
+    Messages.add_reaction_to_message("channel-1-1", "user-1", "👍")
+    Messages.add_reaction_to_message("channel-1-5", "user-1", "👍")
+    Messages.add_reaction_to_message("channel-2-1", "user-1", "👍")
+
+    assert Messages.delete_messages_by_channel_id("channel-1", batch_size=batch_size)
+
+    with messages_db.connect() as conn:
+        message_ids = [
+            row.id for row in conn.execute(Message.__table__.select()).fetchall()
+        ]
+        reaction_message_ids = [
+            row.message_id
+            for row in conn.execute(MessageReaction.__table__.select()).fetchall()
+        ]
+    assert sorted(message_ids) == ["channel-2-1", "channel-2-2"]
+    assert reaction_message_ids == ["channel-2-1"]
+
+    # Nothing left to delete
+    assert Messages.delete_messages_by_channel_id("channel-1", batch_size=batch_size)
@@ -234,3 +234,40 @@ class TestChats(AbstractPostgresTest):
 
         chat = self.chats.get_chat_by_id(chat_id)
         assert chat.share_id is None
+
+    def test_add_message_status_to_chat_by_id_and_message_id(self):
+        from open_webui.models.chats import ChatForm
+
+        message_ids = ["m.1", 'm"1', 'm"].x.["y']
+        chat = self.chats.insert_new_chat(
+            "2",
+            ChatForm(
+                chat={
+                    "title": "Status",
+                    "history": {
+                        "messages": {
+                            message_id: {"id": message_id} for message_id in message_ids
+                        }
+                    },
+                }
+            ),
+        )
+
+        for done in [False, True]:
+            for message_id in message_ids:
+                assert self.chats.add_message_status_to_chat_by_id_and_message_id(
+                    chat.id, message_id, {"action": message_id, "done": done}
+                )
+        assert not self.chats.add_message_status_to_chat_by_id_and_message_id(
+            chat.id, "missing", {"action": "missing"}
+        )
+
+        chat = self.chats.get_chat_by_id(chat.id).chat
+        assert chat["title"] == "Status"
+        messages = chat["history"]["messages"]
+        assert set(messages) == set(message_ids)
+        for message_id in message_ids:
+            assert messages[message_id]["statusHistory"] == [
+                {"action": message_id, "done": False},
+                {"action": message_id, "done": True},
+            ]
@@ -0,0 +1,53 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+
+from open_webui.routers import files as files_router
+
+
+def list_files(**cursor):
+    return asyncio.run(
+        files_router.list_files(
+            user=SimpleNamespace(id="user-1", role="user"),
+            content=False,
+            limit=2,
+            **{"cursor_updated_at": None, "cursor_id": None, **cursor},
+        )
+    )
+
+
+@pytest.mark.parametrize("cursor", [{"cursor_updated_at": 2}, {"cursor_id": "file-3"}])
+def test_list_files_rejects_incomplete_cursor(monkeypatch, cursor):
+    monkeypatch.setattr(
+        files_router.Files,
+        "get_files_by_user_id",
+        lambda *args, **kwargs: pytest.fail("queried with an incomplete cursor"),
+    )
+
+    with pytest.raises(HTTPException) as exc_info:
+        list_files(**cursor)
+    assert exc_info.value.status_code == 400
+
+
+def test_list_files_passes_cursor(monkeypatch):
+    calls = []
+    monkeypatch.setattr(
+        files_router.Files,
+        "get_files_by_user_id",
+        lambda *args, **kwargs: calls.append((args, kwargs)) or [],
+    )
+
+    assert list_files(cursor_updated_at=2, cursor_id="file-3") == []
+    assert calls == [
+        (
+            ("user-1",),
+            {
+                "include_content": False,
+                "cursor_updated_at": 2,
+                "cursor_id": "file-3",
+                "limit": 2,
+            },
+        )
+    ]
@@ -0,0 +1,89 @@
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+
+from open_webui.utils import auth as auth_module
+from open_webui.utils.auth import (
+    API_KEY_REVOKED,
+    get_api_key_cache_key,
+    get_user_by_api_key,
+    invalidate_api_key,
+)
+
+
+class FakeRedis:
+    def __init__(self):
+        self.store = {}
+        # Awaited right before a SET NX, to interleave another request there
+        self.before_nx_set = None
+
+    async def get(self, key):
+        return self.store.get(key)
+
+    async def set(self, key, value, ex=None, nx=False):
+        if nx and self.before_nx_set:
+            await self.before_nx_set()
+        if nx and key in self.store:
+            return None
+        self.store[key] = value
+        return True
+
+
+@pytest.fixture
+def redis():
+    return FakeRedis()
+
+
+@pytest.fixture
+def request_(redis):
+    return SimpleNamespace(app=SimpleNamespace(state=SimpleNamespace(redis=redis)))
+
+
+@pytest.fixture
+def users(monkeypatch):
+    user = SimpleNamespace(id="user-1")
+    users = Mock()
+    users.get_user_by_api_key.return_value = user
+    users.get_user_by_id.return_value = user
+    monkeypatch.setattr(auth_module, "Users", users)
+    return users
+
+
+@pytest.mark.asyncio
+async def test_get_user_by_api_key_caches_user_id(request_, redis, users):
+    assert (await get_user_by_api_key(request_, "sk-1")).id == "user-1"
+    assert redis.store == {get_api_key_cache_key("sk-1"): "user-1"}
+
+    assert (await get_user_by_api_key(request_, "sk-1")).id == "user-1"
+    users.get_user_by_api_key.assert_called_once_with("sk-1")
+    users.get_user_by_id.assert_called_once_with("user-1")
+
+
+@pytest.mark.asyncio
+async def test_invalidated_api_key_is_not_served_from_cache(request_, redis, users):
+    await get_user_by_api_key(request_, "sk-1")
+
+    users.get_user_by_api_key.return_value = None
+    await invalidate_api_key(request_, "sk-1")
+
+    assert await get_user_by_api_key(request_, "sk-1") is None
+    users.get_user_by_id.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_revocation_during_lookup_is_not_overwritten(request_, redis, users):
+    # The lookup reads the key from the database, then the key is regenerated
+    # and invalidated before the lookup gets to cache it
+    async def revoke():
+        users.get_user_by_api_key.return_value = None
+        await invalidate_api_key(request_, "sk-1")
+
+    redis.before_nx_set = revoke
+
+    assert (await get_user_by_api_key(request_, "sk-1")).id == "user-1"
+    assert redis.store[get_api_key_cache_key("sk-1")] == API_KEY_REVOKED
+
+    redis.before_nx_set = None
+    assert await get_user_by_api_key(request_, "sk-1") is None
+    users.get_user_by_id.assert_not_called()
@@ -0,0 +1,97 @@
+import pytest
+from sqlalchemy import null
+from sqlalchemy.orm import Session
+
+from open_webui.models import prompts as prompts_module
+from open_webui.models.prompts import Prompt
+from open_webui.models.users import User
+from open_webui.utils.db import access_control as access_control_module
+from open_webui.utils.db.access_control import get_accessible_rows
+from test.util.sqlite_db import mock_sqlite_db
+
+PROMPTS = [
+    ("own-public", "user-1", None),
+    ("own-private", "user-1", {}),
+    # Python None in a JSON column is stored as JSON null, not SQL NULL
+    ("public", "user-2", None),
+    ("public-sql-null", "user-2", null()),
+    ("private", "user-2", {}),
+    ("group-read", "user-2", {"read": {"group_ids": ["group-1"]}}),
+    ("group-write", "user-2", {"write": {"group_ids": ["group-1"]}}),
+    ("user-write", "user-2", {"write": {"user_ids": ["user-1"]}}),
+    ("other-group-write", "user-2", {"write": {"group_ids": ["group-2"]}}),
+]
+
+
+@pytest.fixture
+def db(monkeypatch):
+    with mock_sqlite_db(
+        monkeypatch, prompts_module, Prompt.__table__, User.__table__
+    ) as engine:
+        with engine.begin() as conn:
+            conn.execute(
+                Prompt.__table__.insert(),
+                [
+                    {
+                        "command": command,
+                        "user_id": user_id,
+                        "title": command,
+                        "content": "",
+                        "timestamp": 0,
+                        "access_control": access_control,
+                    }
+                    for command, user_id, access_control in PROMPTS
+                ],
+            )
+
+        monkeypatch.setattr(
+            access_control_module.Groups,
+            "get_group_ids_by_member_id",
+            lambda user_id: ["group-1"],
+        )
+        with Session(engine) as db:
+            yield db
+
+
+@pytest.fixture
+def checked(monkeypatch):
+    # Access controls has_access was asked about
+    checked = []
+    original_has_access = access_control_module.has_access
+
+    def has_access(user_id, permission, access_control, user_group_ids):
+        checked.append(access_control)
+        return original_has_access(user_id, permission, access_control, user_group_ids)
+
+    monkeypatch.setattr(access_control_module, "has_access", has_access)
+    return checked
+
+
+def commands(db, permission):
+    query = db.query(Prompt, User).outerjoin(User, User.id == Prompt.user_id)
+    return sorted(
+        prompt.command
+        for prompt, _ in get_accessible_rows(query, Prompt, "user-1", permission)
+    )
+
+
+def test_get_accessible_rows_write(db, checked):
+    assert commands(db, "write") == [
+        "group-write",
+        "own-private",
+        "own-public",
+        "user-write",
+    ]
+    # Rows without access control never reach the Python check
+    assert None not in checked
+    assert len(checked) == 5
+
+
+def test_get_accessible_rows_read(db, checked):
+    assert commands(db, "read") == [
+        "group-read",
+        "own-private",
+        "own-public",
+        "public",
+        "public-sql-null",
+    ]
@@ -0,0 +1,45 @@
+import json as stdlib_json
+import math
+
+import pytest
+
+from open_webui.utils import json
+
+
+def test_round_trip():
+    value = {"name": "model", "meta": {"tags": ["a", "b"], "size": 1.5}, 1: None}
+    assert json.loads(json.dumps(value)) == {
+        "name": "model",
+        "meta": {"tags": ["a", "b"], "size": 1.5},
+        "1": None,
+    }
+
+
+def test_dumps_falls_back_for_big_integers():
+    # orjson only handles 64-bit integers
+    value = {"id": 2**64, "ids": [-(2**70)]}
+    assert stdlib_json.loads(json.dumps(value)) == value
+    assert json.loads(json.dumps(value)) == value
+
+
+def test_dumps_writes_non_finite_floats_as_null():
+    assert json.loads(json.dumps({"a": math.nan, "b": math.inf})) == {
+        "a": None,
+        "b": None,
+    }
+
+
+def test_loads_reads_non_finite_floats_written_by_stdlib():
+    # Rows written by json.dumps before orjson was used
+    value = json.loads(stdlib_json.dumps({"a": math.nan, "b": -math.inf}))
+    assert math.isnan(value["a"])
+    assert value["b"] == -math.inf
+
+
+def test_loads_accepts_bytes():
+    assert json.loads(b'{"a": [1, 2]}') == {"a": [1, 2]}
+
+
+def test_loads_invalid_json_still_raises():
+    with pytest.raises(stdlib_json.JSONDecodeError):
+        json.loads('{"a": ')
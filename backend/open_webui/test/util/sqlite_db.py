@@ -0,0 +1,36 @@
+from contextlib import contextmanager
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+
+@contextmanager
+def mock_sqlite_db(monkeypatch, module, *tables):
+    """
+    Point module.get_db at a fresh in-memory SQLite database holding the given
+    tables, for model tests that don't need the full app.
+    """
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    for table in tables:
+        table.create(engine)
+
+    SessionLocal = sessionmaker(bind=engine, expire_on_commit=False)
+
+    @contextmanager
+    def get_db():
+        db = SessionLocal()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    monkeypatch.setattr(module, "get_db", get_db)
+    try:
+        yield engine
+    finally:
+        engine.dispose()
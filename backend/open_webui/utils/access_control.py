@@ -134,10 +134,6 @@ def has_access(
         else:
             return True
 
-    if user_group_ids is None:
-        user_groups = Groups.get_groups_by_member_id(user_id)
-        user_group_ids = {group.id for group in user_groups}
-
     permitted_ids = get_permitted_group_and_user_ids(type, access_control)
     if permitted_ids is None:
         return False
@@ -145,9 +141,17 @@ def has_access(
     permitted_group_ids = permitted_ids.get("group_ids", [])
     permitted_user_ids = permitted_ids.get("user_ids", [])
 
-    return user_id in permitted_user_ids or any(
-        group_id in permitted_group_ids for group_id in user_group_ids
-    )
+    if user_id in permitted_user_ids:
+        return True
+
+    # Only look up the user's groups when some group is actually granted access
+    if not permitted_group_ids:
+        return False
+
+    if user_group_ids is None:
+        user_group_ids = set(Groups.get_group_ids_by_member_id(user_id))
+
+    return not user_group_ids.isdisjoint(permitted_group_ids)
 
 
 # Get all users with access to a resource
@@ -247,6 +247,48 @@ async def invalidate_token(request, token):
                 )
 
 
+# Seconds an api key -> user id mapping stays in Redis; keys are evicted
+# explicitly when they are regenerated or deleted
+API_KEY_CACHE_TTL = 60
+
+# Stored in place of the user id once a key is revoked
+API_KEY_REVOKED = "revoked"
+
+
+def get_api_key_cache_key(api_key: str) -> str:
+    # Never store the raw key in Redis
+    digest = hashlib.sha256(api_key.encode()).hexdigest()
+    return f"{REDIS_KEY_PREFIX}:auth:api_key:{digest}"
+
+
+async def get_user_by_api_key(request, api_key: str):
+    # Share the api key -> user id mapping between workers so repeated API
+    # calls skip the api_key lookup; the user row itself is still read fresh
+    redis = request.app.state.redis
+    if redis:
+        user_id = await redis.get(get_api_key_cache_key(api_key))
+        if user_id and user_id != API_KEY_REVOKED:
+            return Users.get_user_by_id(user_id)
+
+    user = Users.get_user_by_api_key(api_key)
+    if user and redis:
+        # NX: a request that read the key before it was revoked must not
+        # overwrite the tombstone invalidate_api_key left in its place
+        await redis.set(
+            get_api_key_cache_key(api_key), user.id, ex=API_KEY_CACHE_TTL, nx=True
+        )
+    return user
+
+
+async def invalidate_api_key(request, api_key: Optional[str]):
+    # Overwrite rather than delete the entry: the tombstone outlives any
+    # mapping cached from a database read that raced with the revocation
+    if api_key and request.app.state.redis:
+        await request.app.state.redis.set(
+            get_api_key_cache_key(api_key), API_KEY_REVOKED, ex=API_KEY_CACHE_TTL
+        )
+
+
 def extract_token_from_auth_header(auth_header: str):
     return auth_header[len("Bearer ") :]
 
@@ -285,7 +327,7 @@ async def get_current_user(
 
     # auth by api key
     if token.startswith("sk-"):
-        user = get_current_user_by_api_key(request, token)
+        user = await get_current_user_by_api_key(request, token)
 
         # Add user info to current span
         current_span = trace.get_current_span()
@@ -364,8 +406,8 @@ async def get_current_user(
         raise e
 
 
-def get_current_user_by_api_key(request, api_key: str):
-    user = Users.get_user_by_api_key(api_key)
+async def get_current_user_by_api_key(request, api_key: str):
+    user = await get_user_by_api_key(request, api_key)
 
     if user is None:
         raise HTTPException(
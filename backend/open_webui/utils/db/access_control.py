@@ -5,6 +5,9 @@ from sqlalchemy.dialects.postgresql import JSONB
 
 from sqlalchemy import or_, func, select, and_, text, cast, or_, and_, func
 
+from open_webui.models.groups import Groups
+from open_webui.utils.access_control import has_access
+
 
 def has_permission(db, DocumentModel, query, filter: dict, permission: str = "read"):
     group_ids = filter.get("group_ids", [])
@@ -128,3 +131,31 @@ def has_permission(db, DocumentModel, query, filter: dict, permission: str = "re
         query = query.filter(or_(*conditions))
 
     return query
+
+
+def get_accessible_rows(query, DocumentModel, user_id: str, permission: str = "write"):
+    """
+    Run query, whose rows start with a DocumentModel entity, and keep the rows
+    user_id owns or is granted permission on by their access_control.
+    """
+    if permission != "read":
+        # Rows without access control are read-only for non-owners, so only
+        # owned rows and rows with explicit grants can match. A Python None in
+        # a JSON column is stored as JSON null, which passes IS NOT NULL
+        query = query.filter(
+            or_(
+                DocumentModel.user_id == user_id,
+                and_(
+                    DocumentModel.access_control.isnot(None),
+                    cast(DocumentModel.access_control, String) != "null",
+                ),
+            )
+        )
+
+    user_group_ids = set(Groups.get_group_ids_by_member_id(user_id))
+    return [
+        row
+        for row in query.all()
+        if row[0].user_id == user_id
+        or has_access(user_id, permission, row[0].access_control, user_group_ids)
+    ]
@@ -23,6 +23,7 @@ import mimetypes
 import base64
 import io
 import re
+from functools import lru_cache
 
 import requests
 
@@ -30,6 +31,12 @@ BASE64_IMAGE_URL_PREFIX = re.compile(r"data:image/\w+;base64,", re.IGNORECASE)
 MARKDOWN_IMAGE_URL_PATTERN = re.compile(r"!\[(.*?)\]\((.+?)\)", re.IGNORECASE)
 
 
+@lru_cache(maxsize=512)
+def get_content_type_by_extension(extension: str) -> Optional[str]:
+    content_type, _ = mimetypes.guess_type(f"file{extension}")
+    return content_type
+
+
 def get_image_base64_from_url(url: str) -> Optional[str]:
     try:
         if url.startswith("http"):
@@ -52,7 +59,9 @@ def get_image_base64_from_url(url: str) -> Optional[str]:
             if file_path.is_file():
                 with open(file_path, "rb") as image_file:
                     encoded_string = base64.b64encode(image_file.read()).decode("utf-8")
-                    content_type, _ = mimetypes.guess_type(file_path.name)
+                    content_type = get_content_type_by_extension(
+                        file_path.suffix.lower()
+                    )
                     return f"data:{content_type};base64,{encoded_string}"
             else:
                 return None
@@ -155,12 +164,12 @@ def get_file_url_from_base64(request, base64_file_string, metadata, user):
 
 
 def get_image_base64_from_file_id(id: str) -> Optional[str]:
-    file = Files.get_file_by_id(id)
-    if not file:
+    path = Files.get_file_path_by_id(id)
+    if not path:
         return None
 
     try:
-        file_path = Storage.get_file(file.path)
+        file_path = Storage.get_file(path)
         file_path = Path(file_path)
 
         # Check if the file already exists in the cache
@@ -169,7 +178,7 @@ def get_image_base64_from_file_id(id: str) -> Optional[str]:
 
             with open(file_path, "rb") as image_file:
                 encoded_string = base64.b64encode(image_file.read()).decode("utf-8")
-                content_type, _ = mimetypes.guess_type(file_path.name)
+                content_type = get_content_type_by_extension(file_path.suffix.lower())
                 return f"data:{content_type};base64,{encoded_string}"
         else:
             return None
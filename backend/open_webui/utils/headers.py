@@ -1,11 +1,21 @@
+from functools import lru_cache
 from urllib.parse import quote
 
+USER_NAME_HEADER = "X-OpenWebUI-User-Name"
+USER_ID_HEADER = "X-OpenWebUI-User-Id"
+USER_EMAIL_HEADER = "X-OpenWebUI-User-Email"
+USER_ROLE_HEADER = "X-OpenWebUI-User-Role"
+
+
+@lru_cache(maxsize=4096)
+def _quote_user_name(name: str) -> str:
+    return quote(name, safe=" ")
+
 
 def include_user_info_headers(headers, user):
-    return {
-        **headers,
-        "X-OpenWebUI-User-Name": quote(user.name, safe=" "),
-        "X-OpenWebUI-User-Id": user.id,
-        "X-OpenWebUI-User-Email": user.email,
-        "X-OpenWebUI-User-Role": user.role,
-    }
+    headers = dict(headers)
+    headers[USER_NAME_HEADER] = _quote_user_name(user.name)
+    headers[USER_ID_HEADER] = user.id
+    headers[USER_EMAIL_HEADER] = user.email
+    headers[USER_ROLE_HEADER] = user.role
+    return headers
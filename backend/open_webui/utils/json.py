@@ -0,0 +1,35 @@
+import json
+from typing import Any, Callable, Optional, Union
+
+import orjson
+
+
+def dumps(obj: Any, default: Optional[Callable[[Any], Any]] = None) -> str:
+    """
+    Serialize obj to a compact JSON string with orjson.
+
+    Falls back to the stdlib json module for values orjson rejects but json
+    accepts, such as integers outside the 64-bit range. NaN and Infinity are
+    written as null: standard JSON has no representation for them, and
+    browsers and PostgreSQL reject the NaN/Infinity tokens json.dumps emits.
+    """
+    try:
+        return orjson.dumps(
+            obj, default=default, option=orjson.OPT_NON_STR_KEYS
+        ).decode()
+    except TypeError:
+        return json.dumps(obj, default=default, separators=(",", ":"))
+
+
+def loads(s: Union[str, bytes, bytearray]) -> Any:
+    """
+    Parse a JSON document with orjson.
+
+    Falls back to the stdlib json module for documents orjson rejects but json
+    accepts, such as the NaN/Infinity tokens json.dumps writes for non-finite
+    floats. Invalid JSON still raises json.JSONDecodeError.
+    """
+    try:
+        return orjson.loads(s)
+    except orjson.JSONDecodeError:
+        return json.loads(s)
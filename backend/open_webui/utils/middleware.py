@@ -139,6 +139,9 @@ DEFAULT_REASONING_TAGS = [
 DEFAULT_SOLUTION_TAGS = [("<|begin_of_solution|>", "<|end_of_solution|>")]
 DEFAULT_CODE_INTERPRETER_TAGS = [("<code_interpreter>", "</code_interpreter>")]
 
+# Minimum seconds between realtime saves of a streaming message
+REALTIME_CHAT_SAVE_INTERVAL = 1.0
+
 
 def process_tool_result(
     request,
@@ -2509,6 +2512,7 @@ async def process_chat_response(
                         ),
                     )
                     last_delta_data = None
+                    last_realtime_save_at = 0.0
 
                     async def flush_pending_delta_data(threshold: int = 0):
                         nonlocal delta_count
@@ -2543,6 +2547,11 @@ async def process_chat_response(
                         # Remove the prefix
                         data = data[len("data:") :].strip()
 
+                        # The end-of-stream sentinel isn't JSON, don't send it
+                        # through the parser just to catch the error
+                        if data == "[DONE]":
+                            continue
+
                         try:
                             data = json.loads(data)
 
@@ -2804,16 +2813,24 @@ async def process_chat_response(
                                                 break
 
                                         if ENABLE_REALTIME_CHAT_SAVE:
-                                            # Save message in the database
-                                            Chats.upsert_message_to_chat_by_id_and_message_id(
-                                                metadata["chat_id"],
-                                                metadata["message_id"],
-                                                {
-                                                    "content": serialize_content_blocks(
-                                                        content_blocks
-                                                    ),
-                                                },
-                                            )
+                                            # Save message in the database, at most
+                                            # once per interval; the final content is
+                                            # written when the stream ends
+                                            now = time.monotonic()
+                                            if (
+                                                now - last_realtime_save_at
+                                                >= REALTIME_CHAT_SAVE_INTERVAL
+                                            ):
+                                                last_realtime_save_at = now
+                                                Chats.upsert_message_to_chat_by_id_and_message_id(
+                                                    metadata["chat_id"],
+                                                    metadata["message_id"],
+                                                    {
+                                                        "content": serialize_content_blocks(
+                                                            content_blocks
+                                                        ),
+                                                    },
+                                                )
                                         else:
                                             data = {
                                                 "content": serialize_content_blocks(
@@ -2834,12 +2851,8 @@ async def process_chat_response(
                                         }
                                     )
                         except Exception as e:
-                            done = "data: [DONE]" in line
-                            if done:
-                                pass
-                            else:
-                                log.debug(f"Error: {e}")
-                                continue
+                            log.debug(f"Error: {e}")
+                            continue
                     await flush_pending_delta_data()
 
                     if content_blocks:
@@ -3259,15 +3272,14 @@ async def process_chat_response(
                     "title": title,
                 }
 
-                if not ENABLE_REALTIME_CHAT_SAVE:
-                    # Save message in the database
-                    Chats.upsert_message_to_chat_by_id_and_message_id(
-                        metadata["chat_id"],
-                        metadata["message_id"],
-                        {
-                            "content": serialize_content_blocks(content_blocks),
-                        },
-                    )
+                # Save message in the database
+                Chats.upsert_message_to_chat_by_id_and_message_id(
+                    metadata["chat_id"],
+                    metadata["message_id"],
+                    {
+                        "content": serialize_content_blocks(content_blocks),
+                    },
+                )
 
                 # Send a webhook notification if the user is not active
                 if not Users.is_user_active(user.id):
@@ -3297,15 +3309,14 @@ async def process_chat_response(
                 log.warning("Task was cancelled!")
                 await event_emitter({"type": "chat:tasks:cancel"})
 
-                if not ENABLE_REALTIME_CHAT_SAVE:
-                    # Save message in the database
-                    Chats.upsert_message_to_chat_by_id_and_message_id(
-                        metadata["chat_id"],
-                        metadata["message_id"],
-                        {
-                            "content": serialize_content_blocks(content_blocks),
-                        },
-                    )
+                # Save message in the database
+                Chats.upsert_message_to_chat_by_id_and_message_id(
+                    metadata["chat_id"],
+                    metadata["message_id"],
+                    {
+                        "content": serialize_content_blocks(content_blocks),
+                    },
+                )
 
             if response.background is not None:
                 await response.background()
@@ -373,7 +373,7 @@ def get_filtered_models(models, user):
         }
 
         filtered_models = []
-        user_group_ids = {group.id for group in Groups.get_groups_by_member_id(user.id)}
+        user_group_ids = set(Groups.get_group_ids_by_member_id(user.id))
         for model in models:
             if model.get("arena"):
                 if has_access(